@@ -4,10 +4,30 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _json_dumps(obj) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+# Parsed account state per log file, keyed on (mtime_ns, size) so repeated
+# manager instantiations in one process skip the read + JSON decode
+_ACCOUNTS_CACHE: Dict[Path, tuple] = {}
+
 class GeminiAccountManager:
     def __init__(self):
         self.config_dir = Path.home() / '.termi_tool' / 'gemini'
-        self.config_file = self.config_dir / 'accounts.json'
+        self.config_file = self.config_dir / 'accounts.json'  # legacy snapshot
+        self.log_file = self.config_dir / 'accounts.jsonl'
+        self._current_file = self.config_dir / 'current_account'
+        self._log_lines = 0
         self._ensure_config_dir()
         self.accounts = self._load_accounts()
         self.current_account = self._load_current_account()
@@ -15,29 +35,97 @@ class GeminiAccountManager:
     def _ensure_config_dir(self):
         """Ensure configuration directory exists"""
         self.config_dir.mkdir(parents=True, exist_ok=True)
-        if not self.config_file.exists():
-            self._save_accounts({})
+
+    def _log_stat_key(self) -> Optional[tuple]:
+        try:
+            st = os.stat(self.log_file)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def _update_cache(self):
+        _ACCOUNTS_CACHE[self.log_file] = (self._log_stat_key(), self.accounts, self._log_lines)
 
     def _load_accounts(self) -> Dict:
-        """Load accounts from config file"""
+        """Load accounts by replaying the append-only log"""
+        key = self._log_stat_key()
+        cached = _ACCOUNTS_CACHE.get(self.log_file)
+        if cached is not None and cached[0] == key:
+            self._log_lines = cached[2]
+            return cached[1]
+
+        accounts = {}
+        self._log_lines = 0
         try:
-            return json.loads(self.config_file.read_text())
-        except:
+            with open(self.log_file, 'r') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    self._log_lines += 1
+                    record = _json_loads(line)
+                    if record['op'] == 'add':
+                        accounts[record['email']] = {
+                            "api_key": record['api_key'],
+                            "added_at": record['added_at']
+                        }
+                    else:
+                        accounts.pop(record['email'], None)
+        except FileNotFoundError:
+            # Migrate from the legacy accounts.json snapshot if present
+            try:
+                accounts = _json_loads(self.config_file.read_bytes())
+            except Exception:
+                accounts = {}
+            if accounts:
+                # Persist the migration right away: the log is the source
+                # of truth from now on, and an in-memory-only migration
+                # would be dropped on the next load once anything appends
+                # to a fresh log. The legacy snapshot stays as a backup.
+                self.accounts = accounts
+                self._compact()
+        except Exception:
             return {}
 
-    def _save_accounts(self, accounts: Dict):
-        """Save accounts to config file"""
-        self.config_file.write_text(json.dumps(accounts, indent=2))
+        if key is not None:
+            _ACCOUNTS_CACHE[self.log_file] = (key, accounts, self._log_lines)
+        return accounts
+
+    def _append_record(self, record: Dict):
+        """Append one mutation to the log — O(1) instead of rewriting the whole file"""
+        with open(self.log_file, 'a') as f:
+            f.write(_json_dumps(record) + '\n')
+        self._log_lines += 1
+
+        # Compact once the log holds mostly dead entries
+        if self._log_lines > 2 * len(self.accounts) + 8:
+            self._compact()
+        else:
+            self._update_cache()
+
+    def _compact(self):
+        """Rewrite the log as one 'add' record per live account"""
+        tmp = self.log_file.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            for email, data in self.accounts.items():
+                f.write(_json_dumps({"op": "add", "email": email, **data}) + '\n')
+        os.replace(tmp, self.log_file)
+        self._log_lines = len(self.accounts)
+        self._update_cache()
 
     def _load_current_account(self) -> Optional[str]:
         """Load current account from config"""
-        current_file = self.config_dir / 'current_account'
-        return current_file.read_text().strip() if current_file.exists() else None
+        try:
+            return self._current_file.read_text().strip()
+        except FileNotFoundError:
+            return None
 
     def _save_current_account(self, email: str):
-        """Save current account to config"""
-        current_file = self.config_dir / 'current_account'
-        current_file.write_text(email)
+        """Save current account to config (atomic, so a crash mid-write
+        can't leave a truncated pointer file)"""
+        tmp = self._current_file.with_suffix('.tmp')
+        tmp.write_text(email)
+        os.replace(tmp, self._current_file)
 
     def add_account(self, email: str, api_key: str) -> Tuple[bool, str]:
         """Add a new Gemini account"""
@@ -45,11 +133,13 @@ class GeminiAccountManager:
             if email in self.accounts:
                 return False, "Account already exists"
 
+            added_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             self.accounts[email] = {
                 "api_key": api_key,
-                "added_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                "added_at": added_at
             }
-            self._save_accounts(self.accounts)
+            self._append_record({"op": "add", "email": email,
+                                 "api_key": api_key, "added_at": added_at})
 
             # If this is the first account, set it as current
             if len(self.accounts) == 1:
@@ -90,7 +180,7 @@ class GeminiAccountManager:
                 return False, "Account not found"
 
             del self.accounts[email]
-            self._save_accounts(self.accounts)
+            self._append_record({"op": "del", "email": email})
 
             # If deleted account was current, switch to another account if available
             if email == self.current_account:
@@ -100,8 +190,10 @@ class GeminiAccountManager:
                     self.current_account = new_current
                 else:
                     # No accounts left
-                    if (self.config_dir / 'current_account').exists():
-                        (self.config_dir / 'current_account').unlink()
+                    try:
+                        self._current_file.unlink()
+                    except FileNotFoundError:
+                        pass
                     self.current_account = None
 
             return True, "Account deleted successfully"
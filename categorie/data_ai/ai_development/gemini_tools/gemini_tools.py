@@ -1,10 +1,23 @@
 import os
+import functools
 import google.generativeai as genai
 from typing import Optional, List, Tuple
 import subprocess
-from pathlib import Path
+import threading
 from .account_manager import GeminiAccountManager
 
+@functools.lru_cache(maxsize=8)
+def _get_model(api_key: str) -> genai.GenerativeModel:
+    """Build a model once per API key — reusing the model (and its
+    underlying connection state) avoids repeated TLS setup when tools are
+    instantiated many times in one process.
+
+    Note: the SDK credential is global and read at request time, not
+    captured by the model, so callers must genai.configure for the key
+    they want active — the api_key argument here only keys the cache.
+    """
+    return genai.GenerativeModel('gemini-pro')
+
 class GeminiTools:
     def __init__(self, api_key: Optional[str] = None):
         """
@@ -24,8 +37,11 @@ class GeminiTools:
                 raise ValueError("No Gemini account configured. Please add an account first.")
                 
         self.api_key = api_key
-        genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel('gemini-pro')
+        # Always rebind the (global) credential: a cached model hit for
+        # this key would otherwise keep sending requests under whichever
+        # account was configured last
+        genai.configure(api_key=api_key)
+        self.model = _get_model(api_key)
         self.chat = self.model.start_chat(history=[])
 
     def chat_with_ai(self, message: str) -> Tuple[bool, str]:
@@ -78,19 +94,66 @@ Implement JWT-based authentication with refresh tokens"""
         except Exception as e:
             return False, f"Error generating commit message: {str(e)}"
 
+    # Roughly a Gemini prompt's worth of diff text — reading more than
+    # this would only be thrown away by the model's context limit
+    DIFF_BYTE_BUDGET = 32 * 1024
+
     def get_git_diff(self) -> Tuple[bool, str]:
-        """Get the current git diff"""
+        """Get the current git diff, streamed and capped to DIFF_BYTE_BUDGET"""
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 ["git", "diff", "--staged"],
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True
             )
-            if result.returncode == 0:
-                return True, result.stdout
-            else:
-                return False, result.stderr
-                
+            # Drain stderr on a side thread: git can emit more than a pipe
+            # buffer of warnings (e.g. per-file line-ending notices on big
+            # diffs), and an undrained pipe would block the child — and
+            # with it the stdout read loop below
+            stderr_parts: List[str] = []
+
+            def _drain_stderr():
+                try:
+                    stderr_parts.append(proc.stderr.read())
+                except Exception:
+                    pass
+
+            drain = threading.Thread(target=_drain_stderr, daemon=True)
+            drain.start()
+
+            chunks = []
+            total = 0
+            truncated = False
+            while True:
+                chunk = proc.stdout.read(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= self.DIFF_BYTE_BUDGET:
+                    truncated = True
+                    proc.kill()
+                    break
+            proc.wait()
+            drain.join(timeout=5)
+
+            if proc.returncode not in (0, None) and not truncated:
+                return False, ''.join(stderr_parts)
+
+            diff = ''.join(chunks)[:self.DIFF_BYTE_BUDGET]
+            if truncated:
+                # Prepend the (small, bounded) stat summary so the model
+                # still sees the full scope of the change
+                stat = subprocess.run(
+                    ["git", "diff", "--staged", "--stat"],
+                    capture_output=True,
+                    text=True
+                )
+                diff = f"{stat.stdout}\n[diff truncated]\n\n{diff}"
+
+            return True, diff
+
         except Exception as e:
             return False, f"Error getting git diff: {str(e)}"
 
@@ -144,20 +207,15 @@ def main():
                 # Ask if user wants to commit with this message
                 response = input("\nDo you want to commit with this message? (y/N): ")
                 if response.lower() == 'y':
-                    # Write message to temp file to preserve formatting
-                    temp_file = Path("temp_commit_msg.txt")
-                    temp_file.write_text(message)
-                    
-                    # Commit with the message
+                    # Pipe the message via stdin — preserves formatting
+                    # without a temp file that could be left behind
                     result = subprocess.run(
-                        ["git", "commit", "-F", "temp_commit_msg.txt"],
+                        ["git", "commit", "-F", "-"],
+                        input=message,
                         capture_output=True,
                         text=True
                     )
-                    
-                    # Clean up temp file
-                    temp_file.unlink()
-                    
+
                     if result.returncode == 0:
                         print("\nChanges committed successfully!")
                     else:
@@ -1,10 +1,26 @@
 import os
 import subprocess
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Iterable
 import requests
-from huggingface_hub import HfApi, Repository
+from huggingface_hub import HfApi, snapshot_download
 from pathlib import Path
 
+try:
+    # Give the hub client a pooled, keep-alive session so repeated API
+    # calls in one process reuse connections instead of re-handshaking
+    from huggingface_hub import configure_http_backend
+
+    def _pooled_session() -> requests.Session:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    configure_http_backend(backend_factory=_pooled_session)
+except ImportError:
+    pass
+
 class HuggingFaceManager:
     def __init__(self, token: Optional[str] = None):
         """
@@ -16,71 +32,74 @@ class HuggingFaceManager:
         self.token = token or os.getenv("HF_TOKEN")
         self.api = HfApi(token=self.token)
 
-    def clone_repository(self, repo_id: str, local_dir: str, 
+    def clone_repository(self, repo_id: str, local_dir: str,
                         branch: Optional[str] = None) -> Tuple[bool, str]:
         """
-        Clone a model repository from HuggingFace
-        
+        Download a model repository from HuggingFace
+
         Args:
             repo_id (str): Repository ID (e.g., 'username/model-name')
-            local_dir (str): Local directory to clone to
-            branch (str, optional): Branch to clone
-            
+            local_dir (str): Local directory to download to
+            branch (str, optional): Branch/revision to download
+
         Returns:
             Tuple[bool, str]: Success status and message
         """
         try:
-            repo = Repository(
-                local_dir=local_dir,
-                clone_from=repo_id,
+            # snapshot_download fetches over the HTTP CDN with parallel,
+            # resumable workers — much faster than a git clone + LFS smudge,
+            # and needs no git/git-lfs binaries
+            print(f"Downloading repository {repo_id}...")
+            path = snapshot_download(
+                repo_id=repo_id,
+                revision=branch,
                 token=self.token,
-                git_user="HF CLI",
-                revision=branch
+                local_dir=local_dir,
+                max_workers=os.cpu_count() or 4
             )
-            
-            print(f"Cloning repository {repo_id}...")
-            repo.git_pull()
-            
-            return True, f"Successfully cloned {repo_id} to {local_dir}"
-            
+
+            return True, f"Successfully downloaded {repo_id} to {path}"
+
         except Exception as e:
-            return False, f"Error cloning repository: {str(e)}"
+            return False, f"Error downloading repository: {str(e)}"
 
-    def list_models(self, author: Optional[str] = None, 
-                   search: Optional[str] = None, 
-                   task: Optional[str] = None) -> Tuple[bool, List[dict]]:
+    def list_models(self, author: Optional[str] = None,
+                   search: Optional[str] = None,
+                   task: Optional[str] = None,
+                   limit: int = 100) -> Tuple[bool, Iterable[dict]]:
         """
         List models from HuggingFace
-        
+
         Args:
             author (str, optional): Filter by author
             search (str, optional): Search term
             task (str, optional): Filter by task
-            
+            limit (int): Maximum number of models to fetch
+
         Returns:
-            Tuple[bool, List[dict]]: Success status and list of models
+            Tuple[bool, Iterable[dict]]: Success status and lazy iterator
+            of models — results stream in as the API pages, instead of
+            materializing the full (possibly huge) listing up front
         """
         try:
             models = self.api.list_models(
                 author=author,
                 search=search,
-                filter=task
+                filter=task,
+                limit=limit
             )
-            
-            model_list = []
-            for model in models:
-                model_info = {
-                    'id': model.modelId,
-                    'downloads': model.downloads,
-                    'likes': model.likes,
-                    'task': model.pipeline_tag,
-                    'tags': model.tags,
-                    'last_modified': model.lastModified
-                }
-                model_list.append(model_info)
-            
-            return True, model_list
-            
+
+            model_iter = ({
+                'id': model.modelId,
+                'downloads': model.downloads,
+                'likes': model.likes,
+                'task': model.pipeline_tag,
+                'tags': model.tags,
+                'last_modified': model.lastModified
+            } for model in models)
+
+            return True, model_iter
+
         except Exception as e:
             return False, f"Error listing models: {str(e)}"
 
@@ -132,6 +151,8 @@ def main():
     list_parser.add_argument("--author", help="Filter by author")
     list_parser.add_argument("--search", help="Search term")
     list_parser.add_argument("--task", help="Filter by task")
+    list_parser.add_argument("--limit", type=int, default=100,
+                             help="Maximum number of models to list")
     
     # Get model info command
     info_parser = subparsers.add_parser("info", help="Get model information")
@@ -145,16 +166,24 @@ def main():
         print(message)
         
     elif args.command == "list":
-        success, models = manager.list_models(args.author, args.search, args.task)
+        success, models = manager.list_models(args.author, args.search, args.task,
+                                              limit=args.limit)
         if success:
-            print("\nFound Models:")
-            for model in models:
-                print(f"\nID: {model['id']}")
-                print(f"Task: {model['task']}")
-                print(f"Downloads: {model['downloads']}")
-                print(f"Likes: {model['likes']}")
-                if model['tags']:
-                    print(f"Tags: {', '.join(model['tags'])}")
+            # Consume lazily so the first result prints as soon as the
+            # first API page arrives. The iterator is lazy, so HTTP/auth
+            # failures surface here mid-loop rather than in list_models —
+            # catch them and report like any other tool error.
+            try:
+                print("\nFound Models:")
+                for model in models:
+                    print(f"\nID: {model['id']}")
+                    print(f"Task: {model['task']}")
+                    print(f"Downloads: {model['downloads']}")
+                    print(f"Likes: {model['likes']}")
+                    if model['tags']:
+                        print(f"Tags: {', '.join(model['tags'])}")
+            except Exception as e:
+                print(f"Error listing models: {str(e)}")
         else:
             print(f"Error: {models}")
             
@@ -1,11 +1,169 @@
 import os
 import json
+import mmap
 from pathlib import Path
 from typing import Optional, List, Dict
+from collections import defaultdict
 import shutil
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 from tqdm import tqdm
 import sys
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _load_json(path: str):
+    """
+    Whole-file JSON parse, using orjson's C parser when available.
+
+    The file is memory-mapped (with sequential-access advice) so parsing
+    reads straight from the page cache instead of first copying the bytes
+    into a Python object — roughly 1x file size peak RSS rather than 2-3x.
+    """
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty file or platform without mmap support for it
+            data = f.read()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+
+        try:
+            if hasattr(mm, 'madvise'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            view = memoryview(mm)
+            try:
+                if orjson is not None:
+                    return orjson.loads(view)
+                return json.loads(view.tobytes())
+            finally:
+                view.release()
+        finally:
+            mm.close()
+
+_LABEL_FMT = '%d %.6f %.6f %.6f %.6f\n'
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _normalize_bboxes(bboxes, img_width, img_height):
+        out = np.empty_like(bboxes)
+        for i in prange(bboxes.shape[0]):
+            out[i, 0] = (bboxes[i, 0] + bboxes[i, 2] * 0.5) / img_width
+            out[i, 1] = (bboxes[i, 1] + bboxes[i, 3] * 0.5) / img_height
+            out[i, 2] = bboxes[i, 2] / img_width
+            out[i, 3] = bboxes[i, 3] / img_height
+        return out
+else:
+    _normalize_bboxes = None
+
+def _find_annotations_file(folder_path: str) -> Optional[str]:
+    """Locate the COCO annotations file (either *.coco.json or annotations.json) in one readdir"""
+    with os.scandir(folder_path) as it:
+        return next((e.path for e in it
+                     if e.name.endswith('.coco.json') or e.name == 'annotations.json'), None)
+
+def _list_files(folder_path: str) -> set:
+    """Names of all regular files in a directory, from a single scandir pass"""
+    with os.scandir(folder_path) as it:
+        return {e.name for e in it if e.is_file()}
+
+def _scan_annotations(annotations_file: str):
+    """
+    Return (top_level_keys, referenced_image_files) for a COCO annotations
+    file. Streams with ijson when available so multi-GB files never get
+    materialized as a full dict tree; falls back to json.load otherwise.
+    """
+    if ijson is not None:
+        keys = set()
+        image_files = set()
+        with open(annotations_file, 'rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == '' and event == 'map_key':
+                    keys.add(value)
+                elif prefix == 'images.item.file_name':
+                    image_files.add(value)
+        return keys, image_files
+
+    data = _load_json(annotations_file)
+    return set(data.keys()), {img['file_name'] for img in data['images']}
+
+def _iter_coco_items(annotations_file: str, key: str):
+    """Iterate over one top-level COCO list ('images', 'annotations', ...) lazily"""
+    if ijson is not None:
+        with open(annotations_file, 'rb') as f:
+            yield from ijson.items(f, f'{key}.item', use_float=True)
+    else:
+        yield from _load_json(annotations_file)[key]
+
+def _fast_copy(src: str, dst: str) -> None:
+    """
+    Copy a file without reading it through userspace when possible.
+
+    Tries a hardlink first (free when src and dst share a filesystem;
+    the dataset output is treated as read-only so sharing inodes is fine),
+    then an in-kernel copy via os.copy_file_range, and finally falls
+    back to a regular shutil.copy2.
+    """
+    try:
+        if os.path.exists(dst):
+            os.remove(dst)
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fd_in, fd_out = fsrc.fileno(), fdst.fileno()
+                remaining = os.fstat(fd_in).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fd_in, fd_out, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            return
+        except OSError:
+            pass
+
+    shutil.copy2(src, dst)
+
+def _convert_image(job) -> None:
+    """Per-image conversion unit of work (module-level so it pickles for worker processes)"""
+    src_img_path, dst_img_path, label_path, anns, categories, img_width, img_height = job
+    _fast_copy(src_img_path, dst_img_path)
+
+    data = b''
+    if anns:
+        bboxes = np.asarray([ann['bbox'] for ann in anns], dtype=np.float32)
+        yolo_bboxes = COCOtoYOLOConverter.convert_bboxes_batch(bboxes, img_width, img_height)
+        data = ''.join(
+            [_LABEL_FMT % (categories[ann['category_id']], b[0], b[1], b[2], b[3])
+             for ann, b in zip(anns, yolo_bboxes.tolist())]
+        ).encode()
+
+    # One unbuffered write per label (no fsync) — an empty file is still
+    # created for images without annotations
+    fd = os.open(label_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if data:
+            os.write(fd, data)
+    finally:
+        os.close(fd)
+
 class COCOtoYOLOConverter:
     def __init__(self):
         self.required_folders = ['train']
@@ -28,33 +186,27 @@ class COCOtoYOLOConverter:
             folder_path = os.path.join(source_path, folder)
             if os.path.exists(folder_path):
                 # Check for annotations file (either _annotations.coco.json or annotations.json)
-                annotations_file = None
-                for fname in os.listdir(folder_path):
-                    if fname.endswith('.coco.json') or fname == 'annotations.json':
-                        annotations_file = os.path.join(folder_path, fname)
-                        break
-                
+                annotations_file = _find_annotations_file(folder_path)
                 if not annotations_file:
                     print(f"Error: No COCO annotations file found in {folder_path}")
                     return False
                     
                 # Validate annotations file format
                 try:
-                    with open(annotations_file, 'r') as f:
-                        data = json.load(f)
-                        required_keys = ['images', 'annotations', 'categories']
-                        if not all(key in data for key in required_keys):
-                            print(f"Error: Invalid COCO format in {annotations_file}")
-                            return False
-                            
-                        # Verify that the referenced images exist
-                        image_files = {img['file_name'] for img in data['images']}
-                        for img_file in image_files:
-                            img_path = os.path.join(folder_path, img_file)
-                            if not os.path.exists(img_path):
-                                print(f"Error: Referenced image not found: {img_file}")
-                                return False
-                                
+                    keys, image_files = _scan_annotations(annotations_file)
+                    required_keys = ['images', 'annotations', 'categories']
+                    if not all(key in keys for key in required_keys):
+                        print(f"Error: Invalid COCO format in {annotations_file}")
+                        return False
+
+                    # Verify that the referenced images exist — one readdir
+                    # and a set difference instead of a stat call per image
+                    missing = image_files - _list_files(folder_path)
+                    if missing:
+                        print(f"Error: {len(missing)} referenced image(s) not found, "
+                              f"e.g. {next(iter(missing))}")
+                        return False
+
                 except Exception as e:
                     print(f"Error reading annotations file: {str(e)}")
                     return False
@@ -64,10 +216,8 @@ class COCOtoYOLOConverter:
     def validate_destination_path(self, dest_path: str) -> bool:
         """Validate if destination path is valid"""
         try:
-            dest_dir = Path(dest_path)
-            if not dest_dir.exists():
-                print(f"Creating destination directory: {dest_path}")
-                os.makedirs(dest_path)
+            # Single syscall — makedirs handles the already-exists case
+            os.makedirs(dest_path, exist_ok=True)
             return True
         except Exception as e:
             print(f"Error with destination path: {str(e)}")
@@ -85,56 +235,68 @@ class COCOtoYOLOConverter:
         norm_height = height / img_height
         
         return [x_center, y_center, norm_width, norm_height]
-        
+
+    @staticmethod
+    def convert_bboxes_batch(bboxes: 'np.ndarray', img_width: int, img_height: int) -> 'np.ndarray':
+        """Convert an (N, 4) array of COCO bboxes to YOLO format in one vectorized pass"""
+        # COCO: [x_min, y_min, width, height]
+        # YOLO: [x_center, y_center, width, height] (normalized)
+        if _normalize_bboxes is not None:
+            # JIT-compiled, parallel kernel — beats NumPy's per-call
+            # overhead on images with many boxes
+            return _normalize_bboxes(bboxes, np.float32(img_width), np.float32(img_height))
+
+        centers = bboxes[:, :2] + bboxes[:, 2:] * 0.5
+        out = np.concatenate([centers, bboxes[:, 2:]], axis=1)
+        out /= np.array([img_width, img_height, img_width, img_height], dtype=np.float32)
+        return out
+
+
     def convert_folder(self, source_folder: str, dest_folder: str, categories: Dict[int, int]) -> None:
         """Convert a single folder (train/valid/test) from COCO to YOLO format"""
         # Find annotations file
-        annotations_file = None
-        for fname in os.listdir(source_folder):
-            if fname.endswith('.coco.json') or fname == 'annotations.json':
-                annotations_file = os.path.join(source_folder, fname)
-                break
-                
+        annotations_file = _find_annotations_file(source_folder)
+
+
         # Create destination structure
         dest_images = os.path.join(dest_folder, 'images')
         dest_labels = os.path.join(dest_folder, 'labels')
         os.makedirs(dest_images, exist_ok=True)
         os.makedirs(dest_labels, exist_ok=True)
         
-        # Load annotations
-        with open(annotations_file, 'r') as f:
-            coco_data = json.load(f)
-            
-        # Create image id to annotations mapping
-        img_to_anns = {}
-        for ann in coco_data['annotations']:
-            img_id = ann['image_id']
-            if img_id not in img_to_anns:
-                img_to_anns[img_id] = []
-            img_to_anns[img_id].append(ann)
-            
-        # Process each image
-        for img_info in tqdm(coco_data['images'], desc=f"Converting {os.path.basename(source_folder)}"):
+        # Create image id to annotations mapping, streaming the annotations
+        # list so the full JSON tree is never held in memory at once
+        img_to_anns = defaultdict(list)
+        for ann in _iter_coco_items(annotations_file, 'annotations'):
+            img_to_anns[ann['image_id']].append(ann)
+
+        # Build per-image jobs, then fan them out across worker processes —
+        # each image's copy and label write is independent
+        jobs = []
+        # Cache folder prefixes once — os.path.join/splitext per image add
+        # up to several function calls and allocations each on large sets
+        src_prefix = source_folder + os.sep
+        img_prefix = dest_images + os.sep
+        lbl_prefix = dest_labels + os.sep
+        for img_info in _iter_coco_items(annotations_file, 'images'):
             img_id = img_info['id']
             img_name = img_info['file_name']
-            img_width = img_info['width']
-            img_height = img_info['height']
-            
-            # Copy image
-            src_img_path = os.path.join(source_folder, img_name)
-            dst_img_path = os.path.join(dest_images, img_name)
-            shutil.copy2(src_img_path, dst_img_path)
-            
-            # Create YOLO annotation
-            label_name = os.path.splitext(img_name)[0] + '.txt'
-            label_path = os.path.join(dest_labels, label_name)
-            
-            with open(label_path, 'w') as f:
-                if img_id in img_to_anns:
-                    for ann in img_to_anns[img_id]:
-                        cat_id = categories[ann['category_id']]
-                        bbox = self.convert_bbox_coco_to_yolo(ann['bbox'], img_width, img_height)
-                        f.write(f"{cat_id} {' '.join([str(x) for x in bbox])}\n")
+
+            src_img_path = src_prefix + img_name
+            dst_img_path = img_prefix + img_name
+
+            stem = img_name.rpartition('.')[0] or img_name
+            label_path = f"{lbl_prefix}{stem}.txt"
+
+            jobs.append((src_img_path, dst_img_path, label_path,
+                         img_to_anns.get(img_id, []), categories,
+                         img_info['width'], img_info['height']))
+
+        with ProcessPoolExecutor() as executor:
+            for _ in tqdm(executor.map(_convert_image, jobs, chunksize=32),
+                          total=len(jobs),
+                          desc=f"Converting {os.path.basename(source_folder)}"):
+                pass
                         
     def convert(self, source_path: str, dest_path: str) -> bool:
         """Main conversion method"""
@@ -151,24 +313,18 @@ class COCOtoYOLOConverter:
         os.makedirs(dest_folder, exist_ok=True)
         
         # Find train annotations file
-        train_annotations = None
-        train_folder = os.path.join(source_path, 'train')
-        for fname in os.listdir(train_folder):
-            if fname.endswith('.coco.json') or fname == 'annotations.json':
-                train_annotations = os.path.join(train_folder, fname)
-                break
-                
-        # Load categories from train annotations
-        with open(train_annotations, 'r') as f:
-            coco_data = json.load(f)
-            
+        train_annotations = _find_annotations_file(os.path.join(source_path, 'train'))
+
+
+        # Load categories from train annotations (small list, fine to materialize)
+        category_list = list(_iter_coco_items(train_annotations, 'categories'))
+
         # Create category mapping
-        categories = {cat['id']: idx for idx, cat in enumerate(coco_data['categories'])}
-        
-        # Save category names
-        with open(os.path.join(dest_folder, 'classes.txt'), 'w') as f:
-            for cat in sorted(coco_data['categories'], key=lambda x: categories[x['id']]):
-                f.write(f"{cat['name']}\n")
+        categories = {cat['id']: idx for idx, cat in enumerate(category_list)}
+
+        # Save category names — one write instead of a write per line
+        names = [cat['name'] for cat in sorted(category_list, key=lambda x: categories[x['id']])]
+        Path(dest_folder, 'classes.txt').write_text('\n'.join(names) + '\n')
                 
         # Convert each folder
         for folder in self.required_folders + self.optional_folders:
@@ -55,10 +55,17 @@ def add_account_interactive(manager):
         return
 
     try:
-        # Try to validate the API key by making a test connection
-        from roboflow import Roboflow
-        rf = Roboflow(api_key=api_key)
-        ws = rf.workspace()
+        # Validate the key with one lightweight HTTP call instead of the
+        # heavyweight SDK init + full workspace/project enumeration
+        import requests
+        response = requests.get(
+            f"https://api.roboflow.com/{workspace}",
+            params={"api_key": api_key},
+            timeout=5
+        )
+        response.raise_for_status()
+        if not response.json().get("workspace"):
+            raise ValueError(f"Workspace '{workspace}' not found for this API key")
         custom_log(f"Successfully validated API key for workspace: {workspace}", "INFO")
         
         # Save to manager's accounts
@@ -1,21 +1,38 @@
+import builtins
 import os
-from core.utils import print_colored, input_colored, custom_log
+import sys
+from functools import lru_cache
+from core.utils import print_colored, input_colored, custom_log, clear_screen, _color, _CLEAR, _read_menu_key
 from .upload_model.upload_model import RoboflowSessionManager, upload_model_workflow
 from .add_account import add_account_interactive
 from .delete_account import delete_account_interactive
 from .switch_account import switch_account_interactive
 
-try:
-    import readchar
-    from readchar import key
-except ImportError:
-    readchar = None
-    key = None
-    custom_log("readchar module not found - this will affect keyboard input", "ERROR")
+# Per-keystroke logging hits the log file on every key press; only pay for
+# it when explicitly debugging
+_DEBUG = os.environ.get("TERMI_TOOL_DEBUG") == "1"
+
+# Frame-invariant strings for the accounts table, built once
+_ACCT_HEADER = "Index  Workspace              API Key"
+_ACCT_SEP = "-" * 36
+
+@lru_cache(maxsize=16)
+def _breadcrumb(stack: tuple) -> str:
+    """Joined breadcrumb, memoized on the (rarely changing) stack contents"""
+    return " > ".join(stack)
+
+# The option block never changes — render its ANSI once at import
+_MENU_BLOCK = "".join([
+    _color("=== Roboflow Tools ===", "yellow") + "\n",
+    _color("[1] Upload Model", "cyan") + "\n",
+    _color("[a] Add Account", "cyan") + "\n",
+    _color("[d] Delete Account", "cyan") + "\n",
+    _color("[s] Switch Account", "cyan") + "\n",
+    _color("-------------------------", "grey") + "\n",
+    _color("<   Back to previous menu", "magenta") + "\n",
+])
 
 def roboflow_tools_menu():
-    import shutil
-    import builtins
     history_stack = getattr(builtins, "history_stack", None)
     # Ensure Roboflow Tools is in the breadcrumb stack for accurate context
     if history_stack is not None and (not history_stack or history_stack[-1] != "Roboflow Tools"):
@@ -23,29 +40,21 @@ def roboflow_tools_menu():
 
     def show_breadcrumb_local():
         if history_stack:
-            crumb = " > ".join(history_stack)
-            print_colored(crumb, "yellow")
+            print_colored(_breadcrumb(tuple(history_stack)), "yellow")
             print()
 
-    def print_accounts_table(manager):
+    def append_accounts_table(manager, buf):
         if not manager.accounts:
             custom_log("No Roboflow accounts found", "INFO")
             return
-        header = "Index  Workspace              API Key"
-        sep = "-" * 36
-        print()
-        print_colored("=== Roboflow Accounts ===", "yellow")
-        print_colored(header, "green")
-        print_colored(sep, "grey")
-        for idx, username in enumerate(manager.accounts.keys(), 1):
-            acc = manager.accounts[username]
-            api_key = acc['ROBOFLOW_API_KEY']
-            if len(api_key) > 8:
-                masked_api = api_key[:4] + '****' + api_key[-4:]
-            else:
-                masked_api = '*' * len(api_key)
-            print_colored(f"{idx:<6} {username:<22} {masked_api:<22}", "cyan")
-        print()
+        buf.append("\n")
+        buf.append(_color("=== Roboflow Accounts ===", "yellow") + "\n")
+        buf.append(_color(_ACCT_HEADER, "green") + "\n")
+        buf.append(_color(_ACCT_SEP, "grey") + "\n")
+        for idx, (username, acc) in enumerate(manager.accounts.items(), 1):
+            masked_api = manager.masked_key(username, acc['ROBOFLOW_API_KEY'])
+            buf.append(_color(f"{idx:<6} {username:<22} {masked_api:<22}", "cyan") + "\n")
+        buf.append("\n")
 
     # Initialize manager once at the start
     try:
@@ -55,62 +64,52 @@ def roboflow_tools_menu():
         custom_log(f"Error initializing RoboflowSessionManager: {str(e)}", "ERROR")
         return
 
+    # Repaint only when account state may have changed; invalid keys get an
+    # inline notice instead of a full clear+redraw (no flicker per mis-key)
+    dirty = True
     while True:
-        os.system('cls' if os.name == 'nt' else 'clear')
-        show_breadcrumb_local()
-        print_accounts_table(manager)
+        if dirty:
+            # If only one account and current is None or not valid, set it as
+            # current — at most once per session, so a broken state can't
+            # trigger a JSON serialize + disk write on every repaint
+            if len(manager.accounts) == 1 and not getattr(manager, '_auto_assigned', False):
+                only_acc = next(iter(manager.accounts))
+                if not manager.last_username or manager.last_username not in manager.accounts:
+                    manager.last_username = only_acc
+                    custom_log(f"Auto-selected only account: {only_acc}", "INFO")
+                    manager._save_accounts()
+                manager._auto_assigned = True
 
-        # If only one account and current is None or not valid, set it as current
-        if len(manager.accounts) == 1:
-            only_acc = list(manager.accounts.keys())[0]
-            if not manager.last_username or manager.last_username not in manager.accounts:
-                manager.last_username = only_acc
-                custom_log(f"Auto-selected only account: {only_acc}", "INFO")
-                manager._save_accounts()
+            # Build the whole frame in memory and emit it with one write() —
+            # a print per line means a syscall per line on line-buffered TTYs
+            buf = []
+            if history_stack:
+                buf.append(_color(_breadcrumb(tuple(history_stack)), "yellow") + "\n\n")
+            append_accounts_table(manager, buf)
+            buf.append(_MENU_BLOCK)
 
-        print_colored("=== Roboflow Tools ===", "yellow")
-        print_colored("[1] Upload Model", "cyan")
-        print_colored("[a] Add Account", "cyan")
-        print_colored("[d] Delete Account", "cyan")
-        print_colored("[s] Switch Account", "cyan")
-        print_colored("-------------------------", "grey")
-        print_colored("<   Back to previous menu", "magenta")
-        
-        # Get current account status
-        cur = manager.last_username if manager.last_username else "None"
-        if cur != "None":
-            print_colored(f"Current Account: {cur}", "green")
-        else:
-            print_colored(f"Current Account: {cur}", "yellow")
+            # Get current account status
+            cur = manager.last_username if manager.last_username else "None"
+            if cur != "None":
+                buf.append(_color(f"Current Account: {cur}", "green") + "\n")
+            else:
+                buf.append(_color(f"Current Account: {cur}", "yellow") + "\n")
 
-        choice = None
-        if readchar:
-            try:
-                c = readchar.readkey()
-                custom_log(f"Key pressed: {c}", "INFO")
-                if c in ("\x1b", key.ESC, key.LEFT):
-                    custom_log("Exiting Roboflow Tools menu", "INFO")
-                    return
-                if c in ('b', 'B', '<'):
-                    custom_log("Going back from Roboflow Tools menu", "INFO")
-                    return
-                choice = c.lower()
-            except Exception as e:
-                custom_log(f"Error reading key: {str(e)}", "ERROR")
-                choice = None
-        else:
-            try:
-                choice = input_colored("\nSelect option: ", "magenta").strip().lower()
-                custom_log(f"Option selected: {choice}", "INFO")
-                if choice in ('b', 'B', '<'):
-                    custom_log("Going back from Roboflow Tools menu", "INFO")
-                    return
-            except Exception as e:
-                custom_log(f"Error reading input: {str(e)}", "ERROR")
-                choice = None
+            sys.stdout.write(_CLEAR + "".join(buf))
+            sys.stdout.flush()
+
+            dirty = False
+
+        choice = _read_menu_key()
+        if _DEBUG:
+            custom_log(f"Key pressed: {choice}", "INFO")
+        if choice is None:
+            custom_log("Going back from Roboflow Tools menu", "INFO")
+            return
 
         if choice == "1":
-            os.system('cls' if os.name == 'nt' else 'clear')
+            dirty = True
+            clear_screen()
             show_breadcrumb_local()
             print_colored("=== Model Upload ===", "yellow")
             try:
@@ -119,31 +118,32 @@ def roboflow_tools_menu():
                 print_colored(f"Upload failed: {e}", "red")
                 input_colored("Press Enter to continue...", "grey")
         elif choice == "a":
-            os.system('cls' if os.name == 'nt' else 'clear')
+            dirty = True
+            clear_screen()
             show_breadcrumb_local()
             print_colored("Add Roboflow Account", "yellow")
             add_account_interactive(manager)
-            # Reload manager after adding account
-            manager = RoboflowSessionManager()
         elif choice == "d":
-            os.system('cls' if os.name == 'nt' else 'clear')
+            dirty = True
+            clear_screen()
             show_breadcrumb_local()
             delete_account_interactive(manager)
-            # Reload manager after deleting account
-            manager = RoboflowSessionManager()
         elif choice == "s":
+            dirty = True
             try:
                 custom_log("Attempting to switch Roboflow account", "INFO")
-                os.system('cls' if os.name == 'nt' else 'clear')
+                clear_screen()
                 show_breadcrumb_local()
                 print_colored("Switch Roboflow Account", "yellow")
                 switch_account_interactive(manager, print_colored, input_colored, show_breadcrumb_local)
-                # Reload manager after switching account
-                manager = RoboflowSessionManager()
                 custom_log(f"Current account after switch: {manager.last_username}", "INFO")
             except Exception as e:
                 custom_log(f"Error in switch account: {str(e)}", "ERROR")
                 input_colored("Press Enter to continue...", "grey")
         else:
-            print_colored("Invalid choice", "red")
-            input_colored("Press Enter to continue...", "grey")
\ No newline at end of file
+            # Inline notice below the existing frame; erased once acknowledged
+            sys.stdout.write(_color("Invalid choice", "red") + "\x1b[K\n")
+            sys.stdout.flush()
+            input_colored("Press Enter to continue...", "grey")
+            sys.stdout.write("\x1b[2A\x1b[J")
+            sys.stdout.flush()
\ No newline at end of file
@@ -1,72 +1,114 @@
+import atexit
 import os
-import readchar
-from readchar import key
-from core.utils import custom_log
+import queue
+import re
+import sys
+import threading
+from core.utils import custom_log, clear_screen, _color, _read_menu_key
+
+# Pure functions of __file__ — computed once at import instead of
+# re-deriving paths (and recompiling the regex) on every log call
+_ANSI_RE = re.compile(r'\x1b[^m]*m')
+_DEBUG = os.environ.get("TERMI_TOOL_DEBUG") == "1"
+_LOG_DIR = os.path.join(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "..")),
+    "termi_tool")
+_LOG_PATH = os.path.join(_LOG_DIR, "log.txt")
+try:
+    os.makedirs(_LOG_DIR, exist_ok=True)
+    # One persistent buffered handle — an open/write/close per log line
+    # costs several syscalls each; buffered appends cost none (amortized)
+    _LOG_FH = open(_LOG_PATH, "a", encoding="utf-8", buffering=8192)
+    atexit.register(_LOG_FH.close)
+except OSError:
+    _LOG_FH = None
+
+# The roboflow package is heavy (opencv, numpy, ...); load it only when a
+# switch is actually attempted, and reuse clients per API key thereafter
+_RF_CLS = None
+_RF_CLIENTS = {}
+
+def _get_roboflow(api_key):
+    """Return a (cached) Roboflow client for api_key, importing the SDK lazily"""
+    global _RF_CLS
+    client = _RF_CLIENTS.get(api_key)
+    if client is None:
+        if _RF_CLS is None:
+            from roboflow import Roboflow
+            _RF_CLS = Roboflow
+        client = _RF_CLS(api_key=api_key)
+        _RF_CLIENTS[api_key] = client
+    return client
+
+# Log lines are handed to a daemon thread through a queue so the
+# interactive loop never blocks on file I/O; the worker drains whatever
+# has accumulated and writes it as one batch
+_LOG_Q = queue.Queue()
+
+def _log_worker():
+    while True:
+        lines = [_LOG_Q.get()]
+        try:
+            while True:
+                lines.append(_LOG_Q.get_nowait())
+        except queue.Empty:
+            pass
+        try:
+            _LOG_FH.write("\n".join(lines) + "\n")
+            _LOG_FH.flush()
+        except Exception:
+            pass
+
+if _LOG_FH is not None:
+    threading.Thread(target=_log_worker, daemon=True).start()
 
 def log_message(msg: str):
     """Log only specific business logs to <project-root>/termi_tool/log.txt."""
-    try:
-        import re
-        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", ".."))
-        log_dir = os.path.join(project_root, "termi_tool")
-        log_path = os.path.join(log_dir, "log.txt")
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir, exist_ok=True)
-        ansi_escape = re.compile(r'\x1b[^m]*m')
-        log_entry = ansi_escape.sub('', msg)
-        with open(log_path, "a", encoding="utf-8") as logf:
-            logf.write(log_entry + "\n")
-    except Exception:
-        pass
+    if _LOG_FH is None:
+        return
+    _LOG_Q.put_nowait(_ANSI_RE.sub('', msg))
 
 def switch_account_interactive(manager, print_colored, input_colored, show_breadcrumb_local):
     custom_log("Starting switch account interactive", "INFO")
-    while True:
-        os.system('cls' if os.name == 'nt' else 'clear')
+    # Account state cannot change while this menu is up (control returns to
+    # the caller before add/delete run), so snapshot the list once
+    accounts = list(manager.accounts)
+    n_accounts = len(accounts)
+    if not accounts:
+        clear_screen()
         show_breadcrumb_local()
-        accounts = list(manager.accounts.keys())
-        if not accounts:
-            custom_log("No Roboflow accounts available", "ERROR")
-            print_colored("No Roboflow accounts available to switch.", "red")
-            input_colored("Press Enter to continue...", "grey")
-            return
+        custom_log("No Roboflow accounts available", "ERROR")
+        print_colored("No Roboflow accounts available to switch.", "red")
+        input_colored("Press Enter to continue...", "grey")
+        return
 
-        print_colored("Switch Roboflow Account", "yellow")
-        print_colored("Select an account to switch:", "yellow")
+    while True:
+
+        # One write() per frame instead of one per line (see roboflow_tool.py)
+        clear_screen()
+        show_breadcrumb_local()
+        buf = []
+        buf.append(_color("Switch Roboflow Account", "yellow") + "\n")
+        buf.append(_color("Select an account to switch:", "yellow") + "\n")
         for idx, acc in enumerate(accounts, 1):
-            print_colored(f"[{idx}] {acc}", "cyan")
-        print_colored("[B] Cancel or press ESC to go back", "magenta")
+            buf.append(_color(f"[{idx}] {acc}", "cyan") + "\n")
+        buf.append(_color("[B] Cancel or press ESC to go back", "magenta") + "\n")
+        sys.stdout.write("".join(buf))
+        sys.stdout.flush()
 
-        custom_log("Displaying account selection menu", "INFO")
+        if _DEBUG:
+            custom_log("Displaying account selection menu", "INFO")
 
-        if readchar:
-            try:
-                c = readchar.readkey()
-                custom_log(f"Key pressed in switch account: {c}", "INFO")
-                if c in ("\x1b", key.ESC, key.LEFT):
-                    custom_log("Exiting switch account", "INFO")
-                    return
-                if c in ('b', 'B', '<'):
-                    custom_log("Cancelling switch account", "INFO")
-                    return
-                choice = c.lower()
-            except Exception as e:
-                custom_log(f"Error reading key in switch account: {str(e)}", "ERROR")
-                return
-        else:
-            try:
-                choice = input_colored("\nAccount number: ", "magenta").strip().lower()
-                custom_log(f"Account selection input: {choice}", "INFO")
-                if choice in ('b', 'B', '<'):
-                    custom_log("Cancelling switch account", "INFO")
-                    return
-            except Exception as e:
-                custom_log(f"Error reading input in switch account: {str(e)}", "ERROR")
-                return
+        choice = _read_menu_key()
+        if _DEBUG:
+            custom_log(f"Key pressed in switch account: {choice}", "INFO")
+        if choice is None:
+            custom_log("Cancelling switch account", "INFO")
+            return
 
         try:
             sel_idx = int(choice) - 1
-            if sel_idx < 0 or sel_idx >= len(accounts):
+            if sel_idx < 0 or sel_idx >= n_accounts:
                 custom_log(f"Invalid account selection: {choice}", "ERROR")
                 print_colored("Invalid selection.", "red")
                 input_colored("Press Enter to continue...", "grey")
@@ -82,8 +124,7 @@ def switch_account_interactive(manager, print_colored, input_colored, show_bread
 
             try:
                 custom_log(f"Attempting to login with account: {username}", "INFO")
-                from roboflow import Roboflow
-                rf = Roboflow(api_key=api_key)
+                rf = _get_roboflow(api_key)
                 workspace = rf.workspace()
                 print_colored(f"✅ Successfully logged in as: {workspace}", "green")
                 manager.last_username = username
@@ -1,77 +1,226 @@
-import cv2
-import os
-from typing import Optional
-
-def video_to_frames(video_path: str, output_dir: str, frame_interval: Optional[int] = 1) -> bool:
-    """
-    Convert a video file to individual frames
-    
-    Args:
-        video_path (str): Path to the video file
-        output_dir (str): Directory to save the frames
-        frame_interval (int, optional): Interval between frames to save. Defaults to 1 (every frame)
-    
-    Returns:
-        bool: True if successful, False otherwise
-    """
-    try:
-        # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # Open the video file
-        video = cv2.VideoCapture(video_path)
-        if not video.isOpened():
-            print(f"Error: Could not open video file {video_path}")
-            return False
-        
-        # Get video properties
-        total_frames = int(video.get(cv2.CAP_PROP_FRAME_COUNT))
-        fps = video.get(cv2.CAP_PROP_FPS)
-        
-        print(f"Video properties:")
-        print(f"Total frames: {total_frames}")
-        print(f"FPS: {fps}")
-        
-        frame_count = 0
-        saved_count = 0
-        
-        while True:
-            success, frame = video.read()
-            if not success:
-                break
-                
-            if frame_count % frame_interval == 0:
-                frame_filename = os.path.join(output_dir, f"frame_{saved_count:05d}.jpg")
-                cv2.imwrite(frame_filename, frame)
-                saved_count += 1
-                
-                # Print progress
-                if saved_count % 100 == 0:
-                    progress = (frame_count / total_frames) * 100
-                    print(f"Progress: {progress:.1f}% ({saved_count} frames saved)")
-            
-            frame_count += 1
-        
-        video.release()
-        print(f"\nCompleted! Saved {saved_count} frames to {output_dir}")
-        return True
-        
-    except Exception as e:
-        print(f"Error during video conversion: {str(e)}")
-        return False
-
-def main():
-    """CLI interface for video to frames conversion"""
-    import argparse
-    
-    parser = argparse.ArgumentParser(description="Convert video to frames")
-    parser.add_argument("video_path", help="Path to the video file")
-    parser.add_argument("output_dir", help="Directory to save the frames")
-    parser.add_argument("--interval", type=int, default=1, 
-                      help="Save every nth frame (default: 1)")
-    
-    args = parser.parse_args()
-    video_to_frames(args.video_path, args.output_dir, args.interval)
-
-if __name__ == "__main__":
+import cv2
+import io
+import os
+import tarfile
+from tqdm import tqdm
+
+try:
+    # libjpeg-turbo's SIMD DCT/Huffman kernels encode ~2-4x faster than
+    # the libjpeg most OpenCV wheels link against
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    _TURBO = TurboJPEG()
+except Exception:
+    _TURBO = None
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+# Above this sampling interval, per-frame seeks win over sequential grabs
+_SEEK_THRESHOLD = 30
+
+def _worker_count() -> int:
+    """Number of CPUs actually available to this process"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 4
+
+def _create_gpu_reader(video_path: str):
+    """NVDEC-backed video reader, or None when OpenCV lacks CUDA support"""
+    try:
+        if cv2.cuda.getCudaEnabledDeviceCount() > 0:
+            return cv2.cudacodec.createVideoReader(video_path)
+    except (AttributeError, cv2.error):
+        pass
+    return None
+
+def _encode_frame(frame) -> bytes:
+    """JPEG-encode one frame (worker-thread safe; both encoders release the GIL)"""
+    if _TURBO is not None:
+        return _TURBO.encode(frame, quality=90, pixel_format=TJPF_BGR)
+    ok, buf = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 90])
+    return buf.tobytes() if ok else b''
+
+def _write_frame(frame, path: str) -> None:
+    """Encode one frame to JPEG and write it in a single call.
+
+    Runs on worker threads — cv2 releases the GIL during imencode, so
+    encode and disk I/O overlap with the decode loop instead of stalling it.
+    """
+    data = _encode_frame(frame)
+    if data:
+        with open(path, 'wb') as f:
+            f.write(data)
+
+def video_to_frames(video_path: str, output_dir: str, frame_interval: Optional[int] = 1,
+                    use_gpu: bool = False, container: str = 'dir') -> bool:
+    """
+    Convert a video file to individual frames
+    
+    Args:
+        video_path (str): Path to the video file
+        output_dir (str): Directory to save the frames
+        frame_interval (int, optional): Interval between frames to save. Defaults to 1 (every frame)
+        use_gpu (bool, optional): Decode on the GPU via NVDEC when OpenCV
+            was built with CUDA; falls back to the CPU path otherwise
+        container (str, optional): 'dir' writes one .jpg per frame; 'tar'
+            streams every frame into a single frames.tar in output_dir —
+            one open file descriptor and sequential writes instead of an
+            open/write/close syscall trio per frame
+    
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        # Create output directory if it doesn't exist
+        os.makedirs(output_dir, exist_ok=True)
+        
+        # Open the video file
+        video = cv2.VideoCapture(video_path)
+        if not video.isOpened():
+            print(f"Error: Could not open video file {video_path}")
+            return False
+        
+        # Get video properties
+        total_frames = int(video.get(cv2.CAP_PROP_FRAME_COUNT))
+        fps = video.get(cv2.CAP_PROP_FPS)
+        
+        print(f"Video properties:")
+        print(f"Total frames: {total_frames}")
+        print(f"FPS: {fps}")
+        
+        frame_count = 0
+        saved_count = 0
+
+        # Fan encode+write out to a thread pool, keeping at most
+        # 2*nworkers frames in flight so memory stays bounded
+        nworkers = _worker_count()
+        pending = deque()
+
+        # For sparse sampling, seeking straight to each kept frame beats
+        # decoding everything in between; below that threshold, grab()
+        # (header-only parse, no YUV->BGR conversion) still skips the bulk
+        # of the per-frame decode cost on unwanted frames
+        use_seek = frame_interval >= _SEEK_THRESHOLD and total_frames > 0
+
+        # Hardware decode frees every CPU core for the JPEG encode workers;
+        # frames stay on the GPU and are downloaded only when kept
+        gpu_reader = _create_gpu_reader(video_path) if use_gpu else None
+
+        tar = tarfile.open(os.path.join(output_dir, 'frames.tar'), 'w') \
+            if container == 'tar' else None
+
+        # Recycled frame buffers, one per in-flight slot: retrieve() decodes
+        # into a returned buffer instead of allocating ~6MB of fresh numpy
+        # array per kept frame. A buffer goes back on the free list only
+        # after its encode future completes, so reuse can never race.
+        free_bufs = deque()
+
+        def _next_buf():
+            return free_bufs.popleft() if free_bufs else None
+
+        def _drain_one():
+            # Futures complete FIFO-ordered here, so tar members stay sorted
+            fut, name, arr = pending.popleft()
+            data = fut.result()
+            if arr is not None:
+                free_bufs.append(arr)
+            if tar is not None and data:
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+
+        # os.path.join re-checks separators per call; the directory prefix
+        # never changes, so frame paths are plain string concatenation
+        path_prefix = os.path.join(output_dir, "frame_")
+
+        def _submit(frame, recycle=None):
+            nonlocal saved_count
+            suffix = f"{saved_count:05d}.jpg"
+            if len(pending) >= 2 * nworkers:
+                _drain_one()
+            if tar is not None:
+                # Workers only encode; the single tar fd is written here
+                pending.append((executor.submit(_encode_frame, frame), "frame_" + suffix, recycle))
+            else:
+                pending.append(
+                    (executor.submit(_write_frame, frame, path_prefix + suffix),
+                     "frame_" + suffix, recycle))
+            saved_count += 1
+            pbar.update(1)
+
+        # tqdm batches terminal refreshes (~10Hz) instead of a stdout
+        # write per progress line
+        expected = (total_frames + frame_interval - 1) // frame_interval \
+            if total_frames > 0 else None
+        pbar = tqdm(total=expected, unit='frame', desc='Extracting')
+
+        with ThreadPoolExecutor(max_workers=nworkers) as executor:
+            if gpu_reader is not None:
+                while True:
+                    ok, gpu_frame = gpu_reader.nextFrame()
+                    if not ok:
+                        break
+                    if frame_count % frame_interval == 0:
+                        _submit(gpu_frame.download())
+                    frame_count += 1
+            elif use_seek:
+                while True:
+                    frame_count = saved_count * frame_interval
+                    if frame_count >= total_frames:
+                        break
+                    video.set(cv2.CAP_PROP_POS_FRAMES, frame_count)
+                    if not video.grab():
+                        break
+                    buf = _next_buf()
+                    success, frame = video.retrieve(buf)
+                    if not success:
+                        break
+                    _submit(frame, recycle=frame)
+            else:
+                while True:
+                    if not video.grab():
+                        break
+
+                    if frame_count % frame_interval == 0:
+                        buf = _next_buf()
+                        success, frame = video.retrieve(buf)
+                        if success:
+                            _submit(frame, recycle=frame)
+
+                    frame_count += 1
+
+            while pending:
+                _drain_one()
+
+        pbar.close()
+        if tar is not None:
+            tar.close()
+        video.release()
+        print(f"\nCompleted! Saved {saved_count} frames to {output_dir}")
+        return True
+        
+    except Exception as e:
+        print(f"Error during video conversion: {str(e)}")
+        return False
+
+def main():
+    """CLI interface for video to frames conversion"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Convert video to frames")
+    parser.add_argument("video_path", help="Path to the video file")
+    parser.add_argument("output_dir", help="Directory to save the frames")
+    parser.add_argument("--interval", type=int, default=1, 
+                      help="Save every nth frame (default: 1)")
+    parser.add_argument("--gpu", action="store_true",
+                      help="Decode on the GPU (requires CUDA-enabled OpenCV)")
+    parser.add_argument("--container", choices=["dir", "tar"], default="dir",
+                      help="Write loose .jpg files or one frames.tar (default: dir)")
+    
+    args = parser.parse_args()
+    video_to_frames(args.video_path, args.output_dir, args.interval,
+                    use_gpu=args.gpu, container=args.container)
+
+if __name__ == "__main__":
     main() 
\ No newline at end of file
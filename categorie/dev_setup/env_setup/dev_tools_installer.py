@@ -1,261 +1,409 @@
-import os
-import subprocess
-import platform
-from typing import List, Dict, Tuple, Optional
-import json
-from pathlib import Path
-
-class DevToolsInstaller:
-    def __init__(self):
-        self.system = platform.system().lower()
-        self.common_tools = {
-            "git": {
-                "windows": ["winget", "install", "--id", "Git.Git", "-e"],
-                "linux": ["sudo", "apt-get", "install", "-y", "git"],
-                "darwin": ["brew", "install", "git"]
-            },
-            "vscode": {
-                "windows": ["winget", "install", "--id", "Microsoft.VisualStudioCode", "-e"],
-                "linux": ["sudo", "snap", "install", "code", "--classic"],
-                "darwin": ["brew", "install", "--cask", "visual-studio-code"]
-            },
-            "node": {
-                "windows": ["winget", "install", "--id", "OpenJS.NodeJS", "-e"],
-                "linux": ["sudo", "apt-get", "install", "-y", "nodejs", "npm"],
-                "darwin": ["brew", "install", "node"]
-            },
-            "python": {
-                "windows": ["winget", "install", "--id", "Python.Python.3.11", "-e"],
-                "linux": ["sudo", "apt-get", "install", "-y", "python3", "python3-pip"],
-                "darwin": ["brew", "install", "python"]
-            },
-            "docker": {
-                "windows": ["winget", "install", "--id", "Docker.DockerDesktop", "-e"],
-                "linux": [
-                    "sudo", "apt-get", "install", "-y",
-                    "docker.io", "docker-compose"
-                ],
-                "darwin": ["brew", "install", "--cask", "docker"]
-            }
-        }
-
-    def check_package_manager(self) -> Tuple[bool, str]:
-        """Check if the required package manager is installed"""
-        try:
-            if self.system == "windows":
-                result = subprocess.run(["winget", "--version"], 
-                                     capture_output=True, text=True)
-                if result.returncode != 0:
-                    return False, "winget is not installed"
-            
-            elif self.system == "linux":
-                result = subprocess.run(["apt-get", "--version"], 
-                                     capture_output=True, text=True)
-                if result.returncode != 0:
-                    return False, "apt-get is not installed"
-            
-            elif self.system == "darwin":
-                result = subprocess.run(["brew", "--version"], 
-                                     capture_output=True, text=True)
-                if result.returncode != 0:
-                    return False, "Homebrew is not installed"
-            
-            return True, "Package manager is available"
-            
-        except Exception as e:
-            return False, f"Error checking package manager: {str(e)}"
-
-    def install_tool(self, tool_name: str) -> Tuple[bool, str]:
-        """
-        Install a development tool
-        
-        Args:
-            tool_name (str): Name of the tool to install
-            
-        Returns:
-            Tuple[bool, str]: Success status and message
-        """
-        try:
-            if tool_name not in self.common_tools:
-                return False, f"Tool {tool_name} is not supported"
-            
-            if self.system not in self.common_tools[tool_name]:
-                return False, f"Tool {tool_name} is not supported on {self.system}"
-            
-            cmd = self.common_tools[tool_name][self.system]
-            print(f"\nInstalling {tool_name}...")
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                return True, f"{tool_name} installed successfully"
-            else:
-                return False, f"Error installing {tool_name}: {result.stderr}"
-                
-        except Exception as e:
-            return False, f"Error installing {tool_name}: {str(e)}"
-
-    def install_multiple_tools(self, tools: List[str]) -> List[Dict]:
-        """
-        Install multiple development tools
-        
-        Args:
-            tools (List[str]): List of tool names to install
-            
-        Returns:
-            List[Dict]: Installation results for each tool
-        """
-        results = []
-        for tool in tools:
-            success, message = self.install_tool(tool)
-            results.append({
-                'tool': tool,
-                'success': success,
-                'message': message
-            })
-        return results
-
-class AppManager:
-    def __init__(self):
-        self.system = platform.system().lower()
-
-    def list_running_apps(self) -> Tuple[bool, List[Dict]]:
-        """
-        List all running applications
-        
-        Returns:
-            Tuple[bool, List[Dict]]: Success status and list of running apps
-        """
-        try:
-            if self.system == "windows":
-                cmd = ["tasklist", "/FO", "CSV", "/NH"]
-            else:
-                cmd = ["ps", "aux"]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                return False, []
-            
-            apps = []
-            lines = result.stdout.strip().split('\n')
-            
-            if self.system == "windows":
-                for line in lines:
-                    parts = line.strip('"').split('","')
-                    if len(parts) >= 2:
-                        apps.append({
-                            'name': parts[0],
-                            'pid': parts[1],
-                            'memory': parts[4].rstrip('"')
-                        })
-            else:
-                for line in lines[1:]:  # Skip header
-                    parts = line.split()
-                    if len(parts) >= 10:
-                        apps.append({
-                            'name': ' '.join(parts[10:]),
-                            'pid': parts[1],
-                            'cpu': parts[2],
-                            'memory': parts[3]
-                        })
-            
-            return True, apps
-            
-        except Exception as e:
-            return False, f"Error listing apps: {str(e)}"
-
-    def uninstall_app(self, app_name: str) -> Tuple[bool, str]:
-        """
-        Uninstall an application
-        
-        Args:
-            app_name (str): Name of the application to uninstall
-            
-        Returns:
-            Tuple[bool, str]: Success status and message
-        """
-        try:
-            if self.system == "windows":
-                cmd = ["wmic", "product", "where", f"name='{app_name}'", 
-                      "call", "uninstall", "/nointeractive"]
-            elif self.system == "linux":
-                cmd = ["sudo", "apt-get", "remove", "-y", app_name]
-            else:
-                cmd = ["brew", "uninstall", app_name]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                return True, f"{app_name} uninstalled successfully"
-            else:
-                return False, f"Error uninstalling {app_name}: {result.stderr}"
-                
-        except Exception as e:
-            return False, f"Error uninstalling app: {str(e)}"
-
-def main():
-    """CLI interface for developer tools installation and app management"""
-    import argparse
-    
-    parser = argparse.ArgumentParser(description="Developer Tools and App Management")
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
-    
-    # Install tools command
-    install_parser = subparsers.add_parser("install", 
-                                         help="Install development tools")
-    install_parser.add_argument("tools", nargs="+", 
-                              help="Tools to install (git/vscode/node/python/docker)")
-    
-    # List running apps command
-    subparsers.add_parser("list-apps", help="List running applications")
-    
-    # Uninstall app command
-    uninstall_parser = subparsers.add_parser("uninstall", 
-                                           help="Uninstall an application")
-    uninstall_parser.add_argument("app_name", help="Name of the app to uninstall")
-    
-    args = parser.parse_args()
-    
-    if args.command == "install":
-        installer = DevToolsInstaller()
-        
-        # Check package manager
-        success, message = installer.check_package_manager()
-        if not success:
-            print(f"Error: {message}")
-            return
-        
-        # Install tools
-        results = installer.install_multiple_tools(args.tools)
-        
-        print("\nInstallation Results:")
-        for result in results:
-            status = "✓" if result['success'] else "✗"
-            print(f"{status} {result['tool']}: {result['message']}")
-    
-    elif args.command == "list-apps":
-        manager = AppManager()
-        success, apps = manager.list_running_apps()
-        
-        if success and isinstance(apps, list):
-            print("\nRunning Applications:")
-            for app in apps:
-                print(f"\nName: {app['name']}")
-                print(f"PID: {app['pid']}")
-                if 'cpu' in app:
-                    print(f"CPU: {app['cpu']}%")
-                print(f"Memory: {app['memory']}")
-        else:
-            print(f"Error: {apps}")
-    
-    elif args.command == "uninstall":
-        manager = AppManager()
-        success, message = manager.uninstall_app(args.app_name)
-        print(message)
-    
-    else:
-        parser.print_help()
-
-if __name__ == "__main__":
+import asyncio
+import functools
+import os
+import shutil
+import subprocess
+import platform
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Tuple, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+_PACKAGE_MANAGERS = {"windows": "winget", "linux": "apt-get", "darwin": "brew"}
+
+@functools.lru_cache(maxsize=None)
+def _check_package_manager(system: str) -> Tuple[bool, str]:
+    """Probe the platform package manager once per process.
+
+    shutil.which is an in-process PATH scan (a handful of stats) — no
+    fork+exec of a --version probe; tests can
+    _check_package_manager.cache_clear() to force a re-probe.
+    """
+    exe = _PACKAGE_MANAGERS.get(system)
+    if exe is None:
+        return True, "Package manager is available"
+    if shutil.which(exe) is None:
+        return False, f"{exe} is not installed"
+    return True, "Package manager is available"
+
+class DevToolsInstaller:
+    def __init__(self):
+        self.system = platform.system().lower()
+        self.common_tools = {
+            "git": {
+                "windows": ["winget", "install", "--id", "Git.Git", "-e"],
+                "linux": ["sudo", "apt-get", "install", "-y", "git"],
+                "darwin": ["brew", "install", "git"]
+            },
+            "vscode": {
+                "windows": ["winget", "install", "--id", "Microsoft.VisualStudioCode", "-e"],
+                "linux": ["sudo", "snap", "install", "code", "--classic"],
+                "darwin": ["brew", "install", "--cask", "visual-studio-code"]
+            },
+            "node": {
+                "windows": ["winget", "install", "--id", "OpenJS.NodeJS", "-e"],
+                "linux": ["sudo", "apt-get", "install", "-y", "nodejs", "npm"],
+                "darwin": ["brew", "install", "node"]
+            },
+            "python": {
+                "windows": ["winget", "install", "--id", "Python.Python.3.11", "-e"],
+                "linux": ["sudo", "apt-get", "install", "-y", "python3", "python3-pip"],
+                "darwin": ["brew", "install", "python"]
+            },
+            "docker": {
+                "windows": ["winget", "install", "--id", "Docker.DockerDesktop", "-e"],
+                "linux": [
+                    "sudo", "apt-get", "install", "-y",
+                    "docker.io", "docker-compose"
+                ],
+                "darwin": ["brew", "install", "--cask", "docker"]
+            }
+        }
+        # The platform never changes after construction, so resolve each
+        # tool's command once here instead of a two-level lookup per install
+        self._cmd_by_tool = {tool: cmds[self.system]
+                             for tool, cmds in self.common_tools.items()
+                             if self.system in cmds}
+
+    def check_package_manager(self) -> Tuple[bool, str]:
+        """Check if the required package manager is installed"""
+        return _check_package_manager(self.system)
+
+    def install_tool(self, tool_name: str) -> Tuple[bool, str]:
+        """
+        Install a development tool
+        
+        Args:
+            tool_name (str): Name of the tool to install
+            
+        Returns:
+            Tuple[bool, str]: Success status and message
+        """
+        try:
+            cmd = self._cmd_by_tool.get(tool_name)
+            if cmd is None:
+                if tool_name not in self.common_tools:
+                    return False, f"Tool {tool_name} is not supported"
+                return False, f"Tool {tool_name} is not supported on {self.system}"
+
+            print(f"\nInstalling {tool_name}...")
+            
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            
+            if result.returncode == 0:
+                return True, f"{tool_name} installed successfully"
+            else:
+                return False, f"Error installing {tool_name}: {result.stderr}"
+                
+        except Exception as e:
+            return False, f"Error installing {tool_name}: {str(e)}"
+
+    # Install commands that accept several packages in one invocation —
+    # coalescing them pays the manager's dependency resolution once
+    _BATCHABLE_PREFIXES = (("sudo", "apt-get", "install", "-y"),
+                           ("brew", "install"))
+
+    @staticmethod
+    def _package_installed(pkg: str, prefix: Tuple[str, ...]) -> bool:
+        """Check whether a single package landed after a failed batch install"""
+        probe = ["dpkg", "-s", pkg] if prefix[0] == "sudo" else ["brew", "list", pkg]
+        return subprocess.run(probe, capture_output=True, text=True).returncode == 0
+
+    def _batch_install(self, group: List[str], cmds: List[List[str]],
+                       prefix: Tuple[str, ...]) -> List[Dict]:
+        """Install a group of tools with one package-manager invocation"""
+        packages = [pkg for cmd in cmds for pkg in cmd[len(prefix):]]
+        print(f"\nInstalling {', '.join(group)}...")
+        result = subprocess.run(list(prefix) + packages,
+                                capture_output=True, text=True)
+        if result.returncode == 0:
+            return [{'tool': t, 'success': True,
+                     'message': f"{t} installed successfully"} for t in group]
+        # Partial failure: some packages may still have installed — verify
+        # each tool's packages individually before reporting
+        results = []
+        for tool, cmd in zip(group, cmds):
+            ok = all(self._package_installed(pkg, prefix)
+                     for pkg in cmd[len(prefix):])
+            results.append({
+                'tool': tool,
+                'success': ok,
+                'message': (f"{tool} installed successfully" if ok
+                            else f"Error installing {tool}: {result.stderr}")
+            })
+        return results
+
+    def install_multiple_tools(self, tools: List[str]) -> List[Dict]:
+        """
+        Install multiple development tools
+        
+        Args:
+            tools (List[str]): List of tool names to install
+            
+        Returns:
+            List[Dict]: Installation results for each tool
+        """
+        # Installs are network/download-bound, so they overlap well — but
+        # package managers hold a global lock (apt/dpkg, brew), so tools
+        # sharing a manager stay serial within one worker while distinct
+        # managers run in parallel
+        groups: Dict[str, List[str]] = {}
+        for tool in tools:
+            cmd = self._cmd_by_tool.get(tool)
+            mgr = (cmd[1] if cmd[0] == "sudo" else cmd[0]) if cmd else tool
+            groups.setdefault(mgr, []).append(tool)
+
+        def run_group(group: List[str]) -> List[Dict]:
+            # apt/brew accept many packages per call; re-running the manager
+            # per tool repeats its dependency resolution (~1-3s each on apt).
+            # Only commands whose tail is purely package names are coalesced:
+            # per-tool switches like brew's --cask apply to the whole
+            # invocation and would leak onto every other package in the batch.
+            remaining = [(t, self._cmd_by_tool.get(t)) for t in group]
+            results = []
+            for prefix in self._BATCHABLE_PREFIXES:
+                batch = [(t, c) for t, c in remaining
+                         if c is not None
+                         and tuple(c[:len(prefix)]) == prefix
+                         and not any(arg.startswith("-") for arg in c[len(prefix):])]
+                if len(batch) > 1:
+                    names = [t for t, _ in batch]
+                    results += self._batch_install(
+                        names, [c for _, c in batch], prefix)
+                    batched = set(names)
+                    remaining = [(t, c) for t, c in remaining if t not in batched]
+                    break
+            results += [dict(zip(('tool', 'success', 'message'),
+                                 (t, *self.install_tool(t))))
+                        for t, _ in remaining]
+            return results
+
+        results_by_tool = {}
+        with ThreadPoolExecutor(max_workers=min(len(groups), 4)) as executor:
+            futures = [executor.submit(run_group, group) for group in groups.values()]
+            for future in as_completed(futures):
+                for result in future.result():
+                    results_by_tool[result['tool']] = result
+
+        # Report in the order the tools were requested
+        return [results_by_tool[tool] for tool in tools]
+
+    async def _install_tool_async(self, tool_name: str,
+                                  sem: "asyncio.Semaphore") -> Dict:
+        """Install one tool via an asyncio subprocess (no thread per install)"""
+        cmd = self._cmd_by_tool.get(tool_name)
+        if cmd is None:
+            if tool_name not in self.common_tools:
+                return {'tool': tool_name, 'success': False,
+                        'message': f"Tool {tool_name} is not supported"}
+            return {'tool': tool_name, 'success': False,
+                    'message': f"Tool {tool_name} is not supported on {self.system}"}
+        async with sem:
+            print(f"\nInstalling {tool_name}...")
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE)
+                _, stderr = await proc.communicate()
+                if proc.returncode == 0:
+                    return {'tool': tool_name, 'success': True,
+                            'message': f"{tool_name} installed successfully"}
+                return {'tool': tool_name, 'success': False,
+                        'message': f"Error installing {tool_name}: "
+                                   f"{stderr.decode(errors='replace')}"}
+            except Exception as e:
+                return {'tool': tool_name, 'success': False,
+                        'message': f"Error installing {tool_name}: {str(e)}"}
+
+    def install_multiple_tools_async(self, tools: List[str],
+                                     parallel: int) -> List[Dict]:
+        """
+        Install tools concurrently with at most `parallel` in flight.
+
+        The workload is pure subprocess wait, so an event loop covers it
+        without one thread per install. Note that apt/dpkg hold a global
+        lock, so on Linux true parallelism only helps across managers.
+        """
+        async def run():
+            sem = asyncio.Semaphore(parallel)
+            return await asyncio.gather(
+                *(self._install_tool_async(t, sem) for t in tools))
+        return list(asyncio.run(run()))
+
+class AppManager:
+    def __init__(self):
+        self.system = platform.system().lower()
+
+    def _iter_running_apps(self):
+        """Yield running applications one dict at a time.
+
+        Callers that print can emit each entry as it is produced instead of
+        waiting for (and holding) the full process list.
+        """
+        if psutil is not None:
+            # Reads /proc (or the Windows perf counters) directly via a
+            # C extension — no subprocess fork, no text parsing
+            for proc in psutil.process_iter(attrs=['pid', 'name', 'cpu_percent', 'memory_percent']):
+                info = proc.info
+                yield {
+                    'name': info['name'] or '',
+                    'pid': str(info['pid']),
+                    'cpu': f"{info['cpu_percent'] or 0.0:.1f}",
+                    'memory': f"{info['memory_percent'] or 0.0:.1f}"
+                }
+            return
+
+        if self.system == "windows":
+            cmd = ["tasklist", "/FO", "CSV", "/NH"]
+        else:
+            # Headerless fixed columns: 4 fields per line, no command
+            # reconstruction needed
+            cmd = ["ps", "-eo", "pid=,pcpu=,pmem=,comm="]
+
+        result = subprocess.run(cmd, capture_output=True, text=True)
+
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or
+                               f"{cmd[0]} exited with {result.returncode}")
+
+        lines = result.stdout.strip().split('\n')
+
+        if self.system == "windows":
+            for line in lines:
+                parts = line.strip('"').split('","')
+                if len(parts) >= 2:
+                    yield {
+                        'name': parts[0],
+                        'pid': parts[1],
+                        'memory': parts[4].rstrip('"')
+                    }
+        else:
+            for line in lines:
+                parts = line.split(None, 3)
+                if len(parts) == 4:
+                    yield {
+                        'name': parts[3],
+                        'pid': parts[0],
+                        'cpu': parts[1],
+                        'memory': parts[2]
+                    }
+
+    def list_running_apps(self) -> Tuple[bool, List[Dict]]:
+        """
+        List all running applications
+
+        Returns:
+            Tuple[bool, List[Dict]]: Success status and list of running apps
+        """
+        try:
+            return True, list(self._iter_running_apps())
+        except Exception as e:
+            return False, f"Error listing apps: {str(e)}"
+
+    def uninstall_app(self, app_name: str) -> Tuple[bool, str]:
+        """
+        Uninstall an application
+        
+        Args:
+            app_name (str): Name of the application to uninstall
+            
+        Returns:
+            Tuple[bool, str]: Success status and message
+        """
+        try:
+            if self.system == "windows":
+                # winget resolves the app from its index directly; the old
+                # wmic path enumerated every installed MSI product (often
+                # 5-15s) and is deprecated besides
+                cmd = ["winget", "uninstall", "--id", app_name, "-e",
+                       "--silent", "--accept-source-agreements"]
+            elif self.system == "linux":
+                cmd = ["sudo", "apt-get", "remove", "-y", app_name]
+            else:
+                cmd = ["brew", "uninstall", app_name]
+            
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            
+            if result.returncode == 0:
+                return True, f"{app_name} uninstalled successfully"
+            else:
+                return False, f"Error uninstalling {app_name}: {result.stderr}"
+                
+        except Exception as e:
+            return False, f"Error uninstalling app: {str(e)}"
+
+def main():
+    """CLI interface for developer tools installation and app management"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Developer Tools and App Management")
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
+    
+    # Install tools command
+    install_parser = subparsers.add_parser("install", 
+                                         help="Install development tools")
+    install_parser.add_argument("tools", nargs="+",
+                              help="Tools to install (git/vscode/node/python/docker)")
+    install_parser.add_argument("--parallel", type=int, metavar="N",
+                              help="Run up to N installers concurrently via asyncio")
+    
+    # List running apps command
+    subparsers.add_parser("list-apps", help="List running applications")
+    
+    # Uninstall app command
+    uninstall_parser = subparsers.add_parser("uninstall", 
+                                           help="Uninstall an application")
+    uninstall_parser.add_argument("app_name", help="Name of the app to uninstall")
+    
+    args = parser.parse_args()
+    
+    if args.command == "install":
+        installer = DevToolsInstaller()
+        
+        # Check package manager
+        success, message = installer.check_package_manager()
+        if not success:
+            print(f"Error: {message}")
+            return
+        
+        # Install tools
+        if args.parallel:
+            results = installer.install_multiple_tools_async(args.tools,
+                                                             args.parallel)
+        else:
+            results = installer.install_multiple_tools(args.tools)
+        
+        print("\nInstallation Results:")
+        for result in results:
+            status = "✓" if result['success'] else "✗"
+            print(f"{status} {result['tool']}: {result['message']}")
+    
+    elif args.command == "list-apps":
+        manager = AppManager()
+        # Stream straight from the generator — output starts immediately
+        # and Ctrl-C mid-dump keeps everything already printed
+        try:
+            print("\nRunning Applications:")
+            for app in manager._iter_running_apps():
+                print(f"\nName: {app['name']}")
+                print(f"PID: {app['pid']}")
+                if 'cpu' in app:
+                    print(f"CPU: {app['cpu']}%")
+                print(f"Memory: {app['memory']}")
+        except Exception as e:
+            print(f"Error: {e}")
+    
+    elif args.command == "uninstall":
+        manager = AppManager()
+        success, message = manager.uninstall_app(args.app_name)
+        print(message)
+    
+    else:
+        parser.print_help()
+
+if __name__ == "__main__":
     main() 
\ No newline at end of file
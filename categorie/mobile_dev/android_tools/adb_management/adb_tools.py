@@ -1,8 +1,29 @@
 import subprocess
-import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Optional
 
+try:
+    # ppadb speaks the adb protocol over one persistent socket to the
+    # adb server — no fork + CLI handshake (~30-80ms) per operation
+    from ppadb.client import Client as AdbClient
+except ImportError:
+    AdbClient = None
+
 class ADBTools:
+    _client = None
+
+    @classmethod
+    def _get_client(cls):
+        """Cached ppadb client, or None when ppadb/the adb server is unavailable"""
+        if cls._client is None and AdbClient is not None:
+            try:
+                client = AdbClient(host="127.0.0.1", port=5037)
+                client.version()  # probe the server before trusting the client
+                cls._client = client
+            except Exception:
+                return None
+        return cls._client
+
     @staticmethod
     def run_command(command: List[str]) -> Tuple[bool, str]:
         """Run an ADB command and return the result"""
@@ -15,12 +36,44 @@ class ADBTools:
     @staticmethod
     def connect_wifi(ip: str, port: str = "5555") -> Tuple[bool, str]:
         """Connect to device via WiFi ADB"""
+        client = ADBTools._get_client()
+        if client is not None:
+            try:
+                client.remote_connect(ip, int(port))
+                return True, f"connected to {ip}:{port}"
+            except Exception as e:
+                return False, str(e)
         success, output = ADBTools.run_command(["adb", "connect", f"{ip}:{port}"])
         return success, output
 
+    @staticmethod
+    def _get_device_model(device_id: str) -> str:
+        """Query one device's model name via getprop"""
+        success, output = ADBTools.run_command(
+            ["adb", "-s", device_id, "shell", "getprop", "ro.product.model"])
+        return output.strip() if success else ''
+
     @staticmethod
     def list_devices() -> Tuple[bool, List[dict]]:
         """List all connected ADB devices"""
+        client = ADBTools._get_client()
+        if client is not None:
+            try:
+                adb_devices = client.devices()
+                devices = [{'id': d.serial,
+                            'state': d.get_state(),
+                            'description': ''}
+                           for d in adb_devices]
+                if devices:
+                    with ThreadPoolExecutor(max_workers=len(devices)) as ex:
+                        models = ex.map(
+                            lambda d: d.shell("getprop ro.product.model").strip(),
+                            adb_devices)
+                    for device, model in zip(devices, models):
+                        device['model'] = model
+                return True, devices
+            except Exception:
+                return False, []
         success, output = ADBTools.run_command(["adb", "devices", "-l"])
         if not success:
             return False, []
@@ -28,15 +81,24 @@ class ADBTools:
         devices = []
         lines = output.strip().split('\n')[1:]  # Skip first line (header)
         for line in lines:
-            if line.strip():
-                parts = line.split()
-                if len(parts) >= 2:
-                    device = {
-                        'id': parts[0],
-                        'state': parts[1],
-                        'description': ' '.join(parts[2:]) if len(parts) > 2 else ''
-                    }
-                    devices.append(device)
+            # maxsplit=2 stops scanning after id and state, leaving the
+            # description intact instead of splitting and rejoining it
+            parts = line.split(maxsplit=2)
+            if len(parts) >= 2:
+                devices.append({
+                    'id': parts[0],
+                    'state': parts[1],
+                    'description': parts[2] if len(parts) > 2 else ''
+                })
+
+        # Each getprop waits on the device's round trip, not on the CPU, so
+        # querying models concurrently takes one round trip instead of N
+        if devices:
+            with ThreadPoolExecutor(max_workers=len(devices)) as ex:
+                models = ex.map(ADBTools._get_device_model,
+                                (d['id'] for d in devices))
+            for device, model in zip(devices, models):
+                device['model'] = model
         return True, devices
 
     @staticmethod
@@ -48,6 +110,17 @@ class ADBTools:
     @staticmethod
     def uninstall_app(package_name: str, device_id: Optional[str] = None) -> Tuple[bool, str]:
         """Uninstall an app using its package name"""
+        client = ADBTools._get_client()
+        if client is not None:
+            try:
+                device = (client.device(device_id) if device_id
+                          else next(iter(client.devices()), None))
+                if device is None:
+                    return False, "No device found"
+                device.uninstall(package_name)
+                return True, f"Uninstalled {package_name}"
+            except Exception as e:
+                return False, str(e)
         cmd = ["adb"]
         if device_id:
             cmd.extend(["-s", device_id])
@@ -92,6 +165,8 @@ def main():
             for device in devices:
                 print(f"\nDevice ID: {device['id']}")
                 print(f"State: {device['state']}")
+                if device.get('model'):
+                    print(f"Model: {device['model']}")
                 if device['description']:
                     print(f"Description: {device['description']}")
         else:
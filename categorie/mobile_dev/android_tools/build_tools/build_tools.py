@@ -1,9 +1,61 @@
 import os
+import stat
 import subprocess
+from collections import deque
 from typing import Tuple, Optional
-from pathlib import Path
+
+# Projects whose gradlew is already known to be executable — checked at
+# most once per project per run instead of an unconditional chmod per build
+_GRADLEW_READY = {}
 
 class AndroidBuildTools:
+    @staticmethod
+    def _prepare_gradlew(project_path: str) -> Optional[str]:
+        """Locate gradlew and ensure it is executable.
+
+        chmod is only issued when the executable bit is actually missing
+        (a stat is cheaper than an unconditional metadata write), and the
+        result is memoized per project path.
+
+        Returns:
+            Optional[str]: Path to gradlew, or None if not found
+        """
+        gradlew = _GRADLEW_READY.get(project_path)
+        if gradlew is not None:
+            return gradlew
+        gradlew = os.path.join(project_path,
+                               "gradlew.bat" if os.name == "nt" else "gradlew")
+        try:
+            st = os.stat(gradlew)
+        except OSError:
+            return None
+        if os.name != "nt" and not (st.st_mode & stat.S_IXUSR):
+            os.chmod(gradlew, st.st_mode | 0o755)
+        _GRADLEW_READY[project_path] = gradlew
+        return gradlew
+
+    @staticmethod
+    def _run_gradle(cmd: list, project_path: str) -> Tuple[int, str]:
+        """Run a gradle command, streaming its output live.
+
+        capture_output=True buffers the whole build log in memory and shows
+        nothing until gradle exits; streaming prints each line as it arrives
+        and keeps only a bounded tail for error reporting.
+
+        Returns:
+            Tuple[int, str]: gradle's exit code and the last output lines
+        """
+        proc = subprocess.Popen(cmd, cwd=project_path,
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT,
+                                text=True, bufsize=1)
+        tail = deque(maxlen=200)
+        for line in iter(proc.stdout.readline, ''):
+            print(line, end='')
+            tail.append(line)
+        proc.wait()
+        return proc.returncode, ''.join(tail)
+
     @staticmethod
     def generate_aab(project_path: str, output_path: Optional[str] = None,
                     build_type: str = "release") -> Tuple[bool, str]:
@@ -23,16 +75,11 @@ class AndroidBuildTools:
             if not os.path.exists(project_path):
                 return False, f"Project path does not exist: {project_path}"
             
-            # Check if gradlew exists
-            gradlew = os.path.join(project_path, 
-                                 "gradlew.bat" if os.name == "nt" else "gradlew")
-            if not os.path.exists(gradlew):
+            # Check if gradlew exists and is executable
+            gradlew = AndroidBuildTools._prepare_gradlew(project_path)
+            if gradlew is None:
                 return False, f"Gradle wrapper not found in {project_path}"
-            
-            # Make gradlew executable on Unix-like systems
-            if os.name != "nt":
-                os.chmod(gradlew, 0o755)
-            
+
             # Build the command
             cmd = [gradlew]
             if build_type == "release":
@@ -40,22 +87,24 @@ class AndroidBuildTools:
             else:
                 cmd.append("bundleDebug")
             
-            # Run the build command
+            # Run the build command, streaming output as gradle produces it
             print(f"\nBuilding {build_type} AAB...")
-            result = subprocess.run(cmd, cwd=project_path, 
-                                 capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                return False, f"Build failed:\n{result.stderr}"
+            returncode, tail = AndroidBuildTools._run_gradle(cmd, project_path)
+
+            if returncode != 0:
+                return False, f"Build failed:\n{tail}"
             
-            # Find generated AAB file
+            # Find generated AAB file — scandir batches the directory read
+            # and endswith beats glob's fnmatch regex per entry
             app_dir = os.path.join(project_path, "app", "build", "outputs", "bundle", build_type)
-            aab_files = list(Path(app_dir).glob("*.aab"))
-            
+            with os.scandir(app_dir) as it:
+                aab_files = [e.path for e in it
+                             if e.name.endswith('.aab') and e.is_file()]
+
             if not aab_files:
                 return False, "AAB file not found after build"
-            
-            aab_path = str(aab_files[0])
+
+            aab_path = aab_files[0]
             
             # Move to custom output path if specified
             if output_path:
@@ -80,25 +129,18 @@ class AndroidBuildTools:
             Tuple[bool, str]: Success status and message
         """
         try:
-            gradlew = os.path.join(project_path, 
-                                 "gradlew.bat" if os.name == "nt" else "gradlew")
-            
-            if not os.path.exists(gradlew):
+            gradlew = AndroidBuildTools._prepare_gradlew(project_path)
+            if gradlew is None:
                 return False, f"Gradle wrapper not found in {project_path}"
-            
-            # Make gradlew executable on Unix-like systems
-            if os.name != "nt":
-                os.chmod(gradlew, 0o755)
-            
-            # Run clean command
-            result = subprocess.run([gradlew, "clean"], 
-                                 cwd=project_path,
-                                 capture_output=True, text=True)
-            
-            if result.returncode == 0:
+
+            # Run clean command, streaming output as gradle produces it
+            returncode, tail = AndroidBuildTools._run_gradle([gradlew, "clean"],
+                                                             project_path)
+
+            if returncode == 0:
                 return True, "Project cleaned successfully"
             else:
-                return False, f"Clean failed:\n{result.stderr}"
+                return False, f"Clean failed:\n{tail}"
                 
         except Exception as e:
             return False, f"Error cleaning project: {str(e)}"
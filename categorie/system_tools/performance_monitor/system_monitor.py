@@ -1,147 +1,248 @@
-import psutil
-import os
-from typing import Dict, List, Tuple
-from datetime import datetime
-import json
-
-class SystemMonitor:
-    @staticmethod
-    def get_cpu_usage() -> Dict:
-        """Get CPU usage information"""
-        cpu_info = {
-            'total_usage': psutil.cpu_percent(interval=1),
-            'per_cpu': psutil.cpu_percent(interval=1, percpu=True),
-            'cores': psutil.cpu_count(),
-            'physical_cores': psutil.cpu_count(logical=False),
-            'freq': psutil.cpu_freq()._asdict() if psutil.cpu_freq() else {},
-            'stats': psutil.cpu_stats()._asdict()
-        }
-        return cpu_info
-
-    @staticmethod
-    def get_ram_usage() -> Dict:
-        """Get RAM usage information"""
-        memory = psutil.virtual_memory()
-        swap = psutil.swap_memory()
-        
-        ram_info = {
-            'total': memory.total,
-            'available': memory.available,
-            'used': memory.used,
-            'free': memory.free,
-            'percent': memory.percent,
-            'swap': swap._asdict()
-        }
-        return ram_info
-
-    @staticmethod
-    def get_storage_info() -> List[Dict]:
-        """Get storage information for all partitions"""
-        partitions = []
-        for partition in psutil.disk_partitions():
-            try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                partition_info = {
-                    'device': partition.device,
-                    'mountpoint': partition.mountpoint,
-                    'fstype': partition.fstype,
-                    'total': usage.total,
-                    'used': usage.used,
-                    'free': usage.free,
-                    'percent': usage.percent
-                }
-                partitions.append(partition_info)
-            except Exception:
-                continue
-        return partitions
-
-    @staticmethod
-    def get_process_list() -> List[Dict]:
-        """Get list of running processes sorted by memory usage"""
-        processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'status']):
-            try:
-                pinfo = proc.info
-                pinfo['memory_mb'] = proc.memory_info().rss / (1024 * 1024)  # Convert to MB
-                processes.append(pinfo)
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                pass
-        
-        # Sort by memory usage
-        return sorted(processes, key=lambda x: x.get('memory_mb', 0), reverse=True)
-
-def format_bytes(bytes: int) -> str:
-    """Convert bytes to human readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes < 1024:
-            return f"{bytes:.2f} {unit}"
-        bytes /= 1024
-    return f"{bytes:.2f} PB"
-
-def main():
-    """CLI interface for system monitoring"""
-    import argparse
-    
-    parser = argparse.ArgumentParser(description="System Monitoring Tools")
-    parser.add_argument("command", choices=['cpu', 'ram', 'storage', 'processes'],
-                      help="Command to execute")
-    parser.add_argument("--json", action="store_true",
-                      help="Output in JSON format")
-    
-    args = parser.parse_args()
-    
-    if args.command == "cpu":
-        info = SystemMonitor.get_cpu_usage()
-        if args.json:
-            print(json.dumps(info, indent=2))
-        else:
-            print("\nCPU Information:")
-            print(f"Total CPU Usage: {info['total_usage']}%")
-            print(f"Per CPU Usage: {info['per_cpu']}")
-            print(f"Total Cores: {info['cores']}")
-            print(f"Physical Cores: {info['physical_cores']}")
-            if info['freq']:
-                print(f"CPU Frequency: {info['freq']['current']:.2f} MHz")
-    
-    elif args.command == "ram":
-        info = SystemMonitor.get_ram_usage()
-        if args.json:
-            print(json.dumps(info, indent=2))
-        else:
-            print("\nRAM Information:")
-            print(f"Total RAM: {format_bytes(info['total'])}")
-            print(f"Used RAM: {format_bytes(info['used'])} ({info['percent']}%)")
-            print(f"Available RAM: {format_bytes(info['available'])}")
-            print(f"Free RAM: {format_bytes(info['free'])}")
-            print("\nSwap Information:")
-            print(f"Total Swap: {format_bytes(info['swap']['total'])}")
-            print(f"Used Swap: {format_bytes(info['swap']['used'])} ({info['swap']['percent']}%)")
-    
-    elif args.command == "storage":
-        info = SystemMonitor.get_storage_info()
-        if args.json:
-            print(json.dumps(info, indent=2))
-        else:
-            print("\nStorage Information:")
-            for partition in info:
-                print(f"\nDevice: {partition['device']}")
-                print(f"Mount Point: {partition['mountpoint']}")
-                print(f"File System: {partition['fstype']}")
-                print(f"Total Space: {format_bytes(partition['total'])}")
-                print(f"Used Space: {format_bytes(partition['used'])} ({partition['percent']}%)")
-                print(f"Free Space: {format_bytes(partition['free'])}")
-    
-    elif args.command == "processes":
-        info = SystemMonitor.get_process_list()
-        if args.json:
-            print(json.dumps(info, indent=2))
-        else:
-            print("\nTop Processes by Memory Usage:")
-            print(f"{'PID':>7} {'Memory (MB)':>12} {'CPU %':>7} {'Status':>10} Process Name")
-            print("-" * 60)
-            for proc in info[:20]:  # Show top 20 processes
-                print(f"{proc['pid']:>7} {proc['memory_mb']:>12.2f} {proc['cpu_percent']:>7.1f} "
-                      f"{proc['status']:>10} {proc['name']}")
-
-if __name__ == "__main__":
+import functools
+import heapq
+import psutil
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+# Prime psutil's CPU-time baselines so later interval=None reads return a
+# delta over a real window instead of a meaningless 0.0 first sample
+psutil.cpu_percent(interval=None)
+psutil.cpu_percent(interval=None, percpu=True)
+
+# Storage layout changes rarely, and partition/statfs reads can block on
+# dead network mounts — a short TTL lets back-to-back menu refreshes reuse
+# the previous answer instead of re-issuing the syscalls
+_DISK_TTL = 5.0
+_part_cache = {'t': 0.0, 'v': None}
+_usage_cache = {}
+
+def _cached_partitions():
+    """psutil.disk_partitions with a 5s TTL (physical devices only)"""
+    now = time.monotonic()
+    if _part_cache['v'] is None or now - _part_cache['t'] >= _DISK_TTL:
+        _part_cache['v'] = psutil.disk_partitions(all=False)
+        _part_cache['t'] = now
+    return _part_cache['v']
+
+def _cached_usage(mountpoint: str):
+    """psutil.disk_usage with a 5s TTL per mountpoint"""
+    now = time.monotonic()
+    hit = _usage_cache.get(mountpoint)
+    if hit is not None and now - hit[0] < _DISK_TTL:
+        return hit[1]
+    usage = psutil.disk_usage(mountpoint)
+    _usage_cache[mountpoint] = (now, usage)
+    return usage
+
+class SystemMonitor:
+    # Core counts cannot change at runtime — resolve them once
+    _CORES = psutil.cpu_count()
+    _PHYSICAL_CORES = psutil.cpu_count(logical=False)
+
+    @staticmethod
+    def get_cpu_usage() -> Dict:
+        """Get CPU usage information"""
+        # One shared 1s window: sleep once, then take the aggregate and
+        # per-CPU percentages non-blockingly from the primed baselines.
+        # Two back-to-back interval=1 calls would block for 2s and parse
+        # /proc/stat twice as often for the same information.
+        time.sleep(1)
+        cpu_info = {
+            'total_usage': psutil.cpu_percent(interval=None),
+            'per_cpu': psutil.cpu_percent(interval=None, percpu=True),
+            'cores': SystemMonitor._CORES,
+            'physical_cores': SystemMonitor._PHYSICAL_CORES,
+            'freq': psutil.cpu_freq()._asdict() if psutil.cpu_freq() else {},
+            'stats': psutil.cpu_stats()._asdict()
+        }
+        return cpu_info
+
+    @staticmethod
+    def get_ram_usage() -> Dict:
+        """Get RAM usage information"""
+        memory = psutil.virtual_memory()
+        swap = psutil.swap_memory()
+        
+        ram_info = {
+            'total': memory.total,
+            'available': memory.available,
+            'used': memory.used,
+            'free': memory.free,
+            'percent': memory.percent,
+            'swap': swap._asdict()
+        }
+        return ram_info
+
+    @staticmethod
+    def get_storage_info() -> List[Dict]:
+        """Get storage information for all partitions"""
+        parts = _cached_partitions()
+        if not parts:
+            return []
+
+        def _safe_usage(mountpoint):
+            try:
+                return _cached_usage(mountpoint)
+            except OSError:
+                return None
+
+        # statfs releases the GIL, so mapping over a thread pool turns the
+        # uncached first pass from sum(latencies) into max(latencies) —
+        # one slow network mount no longer serializes the whole report
+        with ThreadPoolExecutor(max_workers=min(8, len(parts))) as ex:
+            usages = ex.map(lambda p: _safe_usage(p.mountpoint), parts)
+
+        partitions = []
+        for partition, usage in zip(parts, usages):
+            if usage is None:
+                continue
+            partitions.append({
+                'device': partition.device,
+                'mountpoint': partition.mountpoint,
+                'fstype': partition.fstype,
+                'total': usage.total,
+                'used': usage.used,
+                'free': usage.free,
+                'percent': usage.percent
+            })
+        return partitions
+
+    @staticmethod
+    def get_process_list(top_k: Optional[int] = None,
+                         sample_cpu: bool = False) -> List[Dict]:
+        """Get list of running processes sorted by memory usage.
+
+        Args:
+            top_k (int, optional): Return only the top_k heaviest processes.
+                heapq.nlargest is O(N log k) versus the full sort's
+                O(N log N), and callers displaying a fixed window avoid
+                carrying the whole list around.
+            sample_cpu (bool): Take a real two-sample CPU reading (~0.5s
+                pause). A single cpu_percent() call always reports 0.0 while
+                still paying for per-process CPU-time bookkeeping, so by
+                default the column is reported as 0.0 without that work.
+        """
+        if sample_cpu:
+            # Prime every process's CPU baseline, wait one window, then
+            # read the deltas in the main pass below
+            procs = list(psutil.process_iter())
+            for proc in procs:
+                try:
+                    proc.cpu_percent()
+                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                    pass
+            time.sleep(0.5)
+        else:
+            procs = psutil.process_iter()
+
+        processes = []
+        for proc in procs:
+            try:
+                # oneshot coalesces the /proc/<pid>/stat+statm reads behind
+                # these accessors into a single pass per process instead of
+                # one kernel round-trip per attribute
+                with proc.oneshot():
+                    mem = proc.memory_info()
+                    processes.append({
+                        'pid': proc.pid,
+                        'name': proc.name(),
+                        'cpu_percent': proc.cpu_percent() if sample_cpu else 0.0,
+                        'memory_percent': proc.memory_percent(),
+                        'status': proc.status(),
+                        'memory_mb': mem.rss / (1024 * 1024)  # Convert to MB
+                    })
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                pass
+        
+        # Sort by memory usage
+        key = lambda x: x.get('memory_mb', 0)
+        if top_k is not None:
+            return heapq.nlargest(top_k, processes, key=key)
+        return sorted(processes, key=key, reverse=True)
+
+@functools.lru_cache(maxsize=1024)
+def format_bytes(bytes: int) -> str:
+    """Convert bytes to human readable format.
+
+    Memoized: disk totals and most usage figures repeat across successive
+    renders, and a cache hit skips the division loop and string format.
+    """
+    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+        if bytes < 1024:
+            return f"{bytes:.2f} {unit}"
+        bytes /= 1024
+    return f"{bytes:.2f} PB"
+
+def main():
+    """CLI interface for system monitoring"""
+    import argparse
+    import json
+    
+    parser = argparse.ArgumentParser(description="System Monitoring Tools")
+    parser.add_argument("command", choices=['cpu', 'ram', 'storage', 'processes'],
+                      help="Command to execute")
+    parser.add_argument("--json", action="store_true",
+                      help="Output in JSON format")
+    
+    args = parser.parse_args()
+    
+    if args.command == "cpu":
+        info = SystemMonitor.get_cpu_usage()
+        if args.json:
+            print(json.dumps(info, indent=2))
+        else:
+            print("\nCPU Information:")
+            print(f"Total CPU Usage: {info['total_usage']}%")
+            print(f"Per CPU Usage: {info['per_cpu']}")
+            print(f"Total Cores: {info['cores']}")
+            print(f"Physical Cores: {info['physical_cores']}")
+            if info['freq']:
+                print(f"CPU Frequency: {info['freq']['current']:.2f} MHz")
+    
+    elif args.command == "ram":
+        info = SystemMonitor.get_ram_usage()
+        if args.json:
+            print(json.dumps(info, indent=2))
+        else:
+            print("\nRAM Information:")
+            print(f"Total RAM: {format_bytes(info['total'])}")
+            print(f"Used RAM: {format_bytes(info['used'])} ({info['percent']}%)")
+            print(f"Available RAM: {format_bytes(info['available'])}")
+            print(f"Free RAM: {format_bytes(info['free'])}")
+            print("\nSwap Information:")
+            print(f"Total Swap: {format_bytes(info['swap']['total'])}")
+            print(f"Used Swap: {format_bytes(info['swap']['used'])} ({info['swap']['percent']}%)")
+    
+    elif args.command == "storage":
+        info = SystemMonitor.get_storage_info()
+        if args.json:
+            print(json.dumps(info, indent=2))
+        else:
+            print("\nStorage Information:")
+            for partition in info:
+                print(f"\nDevice: {partition['device']}")
+                print(f"Mount Point: {partition['mountpoint']}")
+                print(f"File System: {partition['fstype']}")
+                print(f"Total Space: {format_bytes(partition['total'])}")
+                print(f"Used Space: {format_bytes(partition['used'])} ({partition['percent']}%)")
+                print(f"Free Space: {format_bytes(partition['free'])}")
+    
+    elif args.command == "processes":
+        if args.json:
+            info = SystemMonitor.get_process_list()
+            print(json.dumps(info, indent=2))
+        else:
+            # Only the top 20 are shown — let get_process_list keep a
+            # 20-element heap instead of sorting everything
+            info = SystemMonitor.get_process_list(top_k=20, sample_cpu=True)
+            print("\nTop Processes by Memory Usage:")
+            print(f"{'PID':>7} {'Memory (MB)':>12} {'CPU %':>7} {'Status':>10} Process Name")
+            print("-" * 60)
+            for proc in info:
+                print(f"{proc['pid']:>7} {proc['memory_mb']:>12.2f} {proc['cpu_percent']:>7.1f} "
+                      f"{proc['status']:>10} {proc['name']}")
+
+if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -1,13 +1,104 @@
 import os
 import platform
+import sys
+import time
 from typing import List, Dict, Optional
-import datetime
-import psutil
+from core.utils import clear_screen as _ansi_clear
+
+# ASCII stand-ins for the menu emoji — multi-byte glyphs cost the
+# terminal grapheme-width work per redraw and render poorly over dumb
+# TTYs, so the build pass can bake these in instead
+_ASCII_SUBS = {
+    "📍": "[*]",
+    "⬅️": "[<]",
+    "🏠": "[M]",
+    "🚪": "[X]",
+    "📊": "[D]",
+    "📱": "[P]",
+    "⚙️": "[S]",
+    "🔧": "[T]",
+}
+
+def _to_ascii(text: str) -> str:
+    """Replace the known emoji markers with their ASCII equivalents"""
+    for emoji, sub in _ASCII_SUBS.items():
+        text = text.replace(emoji, sub)
+    return text
+
+# psutil takes tens of milliseconds to import and get_system_info may never
+# run in a session — load it on first use and prime its baseline then
+_psutil = None
+
+def _get_psutil():
+    global _psutil
+    if _psutil is None:
+        import psutil
+        psutil.cpu_percent(interval=None)
+        _psutil = psutil
+    return _psutil
 
 class Menu:
+    # The menu layout is static, so every frame can be rendered to a string
+    # up front — one stdout write per draw instead of a print (GIL + lock +
+    # flush) per line
+    _MAIN_MENU = (
+        "+-------+----------------------------------+\n"
+        "| Index |              Title               |\n"
+        "+-------+----------------------------------+\n"
+        "|   1   | 📊 Data & AI Utilities           |\n"
+        "|   2   | 📱 Mobile Development            |\n"
+        "|   3   | ⚙️  System Tools                  |\n"
+        "|   4   | 🔧 Developer Setup               |\n"
+        "+-------+----------------------------------+\n"
+        "|   0   | 🚪 Exit                          |\n"
+        "+-------+----------------------------------+\n"
+    )
+
+    _BANNER = (
+        "\n+---------------------------------------------------------------+\n"
+        "|                    TERMINAL TOOL DASHBOARD                    |\n"
+        "|                  'Infinite Function Toolkit'                  |\n"
+        "+---------------------------------------------------------------+\n\n"
+    )
+
+    _TABLE_HEADER = (
+        "+-------+----------------------------------+\n"
+        "| Index |              Title               |\n"
+        "+-------+----------------------------------+\n"
+    )
+
+    _NAV_FOOTER = (
+        "+-------+----------------------------------+\n"
+        "|   b   | ⬅️ Back                           |\n"
+        "|   m   | 🏠 Main Menu                     |\n"
+        "|   0   | 🚪 Exit                          |\n"
+        "+-------+----------------------------------+\n"
+    )
+
+    # The account table at this path is live data; it renders between the
+    # breadcrumb and the (static) items table
+    _GEMINI_ACCOUNTS_PATH = ("1", "3", "2", "3")
+
+    # Navigation keys valid on every screen — hashed membership beats a
+    # per-keystroke list scan
+    _NAV_KEYS = frozenset({'0', 'b', 'm'})
     def __init__(self):
         self.system = platform.system().lower()
-        self.clear_command = 'cls' if self.system == 'windows' else 'clear'
+        # Emoji only when writing to a real terminal; TERMI_ASCII forces
+        # the plain variant (useful over SSH or in logs). Decided once —
+        # both render variants are baked by the build pass below.
+        self._ascii = not sys.stdout.isatty() or bool(os.environ.get("TERMI_ASCII"))
+        # The platform facts never change — resolve them once here
+        self._platform_info = {
+            'platform': platform.system(),
+            'python': platform.python_version(),
+            'processor': platform.processor()
+        }
+        self._sysinfo_cache = (0.0, None)
+        # Exponential moving average over the instantaneous CPU readings —
+        # interval=None samples are jumpy, and smoothing here keeps the
+        # header stable without ever blocking on a sampling window
+        self._cpu_ema = None
         self.menus = {
             "1": {
                 "title": "Data & AI Utilities",
@@ -156,38 +247,117 @@ class Menu:
                 }
             }
         }
+        self._build_index()
+
+    @classmethod
+    def _intern_keys(cls, items):
+        """Rebuild a menu items dict with sys.intern'd keys.
+
+        Interned keys let the per-keystroke dict probes short-circuit on
+        pointer equality once get_input interns what the user typed,
+        instead of comparing string contents.
+        """
+        out = {}
+        for key, value in items.items():
+            if isinstance(value, dict):
+                value = dict(value, items=cls._intern_keys(value["items"]))
+            out[sys.intern(key)] = value
+        return out
+
+    def _build_index(self):
+        """Flatten the nested menu tree into a single path -> node map.
+
+        Navigating then costs one dict probe per keystroke instead of
+        re-walking the 4-level structure (with its items-unwrapping
+        branches) on every render and validity check.
+        """
+        self.menus = self._intern_keys(self.menus)
+        deco = _to_ascii if self._ascii else (lambda s: s)
+        self._main_frame = deco(self._MAIN_MENU).encode("utf-8")
+        self._nodes = {}
+        self._rendered = {}
+        self._frames = {}
+        self._valid_keys = {}
+        self._current_valid = frozenset()
+        leaf_paths = set()
+
+        def walk(items, path, titles):
+            self._nodes[path] = (items, titles)
+            self._valid_keys[path] = frozenset(items)
+            crumb = f"📍 {' > '.join(('Main Menu',) + titles):<59}"
+            lines = [self._TABLE_HEADER]
+            for key, value in items.items():
+                # The account list is shown automatically on the gemini
+                # accounts menu, so its "List Accounts" entry is dropped
+                if path == self._GEMINI_ACCOUNTS_PATH and key == "2":
+                    continue
+                title = value["title"] if isinstance(value, dict) else value
+                lines.append(f"|   {key:<3} | {title:<32} |\n")
+            lines.append(self._NAV_FOOTER)
+            crumb = deco(crumb)
+            table = deco("".join(lines))
+            self._rendered[path] = (crumb, table)
+            # Complete frame (breadcrumb + table), joined and UTF-8
+            # encoded once here — the common redraw is then a single
+            # buffer write with no per-draw encoder pass
+            self._frames[path] = (crumb + "\n" + table).encode("utf-8")
+            for key, value in items.items():
+                if isinstance(value, dict):
+                    walk(value["items"], path + (key,), titles + (value["title"],))
+                else:
+                    leaf_paths.add(path + (key,))
+
+        walk(self.menus, (), ())
+        # Tool entries (raw strings in the tree) keyed by full path — the
+        # main loop's tool-vs-submenu branch is then one set probe instead
+        # of a node lookup plus isinstance check per selection
+        self._leaf_paths = frozenset(leaf_paths)
 
     def clear_screen(self):
         """Clear the terminal screen"""
-        os.system(self.clear_command)
+        # core.utils emits the ANSI erase sequence directly (with the
+        # colorama VT shim on Windows) — no fork+exec of clear/cls per draw
+        _ansi_clear()
 
     def get_system_info(self):
         """Get basic system information"""
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # Readings stay fresh to within a second; within that window
+        # repeated header draws reuse the cached dict
+        now = time.monotonic()
+        stamp, info = self._sysinfo_cache
+        if info is not None and now - stamp < 1.0:
+            return info
+        psutil = _get_psutil()
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage('/')
-        return {
-            'cpu': cpu_percent,
+        cpu = psutil.cpu_percent(interval=None)
+        if self._cpu_ema is None:
+            self._cpu_ema = cpu
+        else:
+            self._cpu_ema = 0.3 * cpu + 0.7 * self._cpu_ema
+        info = {
+            'cpu': round(self._cpu_ema, 1),
             'memory': memory.percent,
             'disk': disk.percent,
-            'platform': platform.system(),
-            'python': platform.python_version(),
-            'processor': platform.processor()
+            **self._platform_info
         }
+        self._sysinfo_cache = (now, info)
+        return info
 
     def print_header(self):
         """Print the application header with system information"""
         self.clear_screen()
-        
-        print("\n+---------------------------------------------------------------+")
-        print("|                    TERMINAL TOOL DASHBOARD                    |")
-        print("|                  'Infinite Function Toolkit'                  |")
-        print("+---------------------------------------------------------------+\n")
+        sys.stdout.write(self._BANNER)
 
     def print_menu(self, current_path: List[str] = None):
         """Print the menu based on current path"""
         self.print_header()
-        
+
+        # Remember which keys the displayed menu accepts so validity
+        # checks are a pair of frozenset probes
+        self._current_valid = self._valid_keys.get(
+            tuple(current_path or ()), frozenset())
+
         if not current_path:
             self._print_main_menu()
         else:
@@ -195,101 +365,85 @@ class Menu:
 
     def _print_main_menu(self):
         """Print the main menu options"""
-        print("+-------+----------------------------------+")
-        print("| Index |              Title               |")
-        print("+-------+----------------------------------+")
-        print("|   1   | 📊 Data & AI Utilities           |")
-        print("|   2   | 📱 Mobile Development            |")
-        print("|   3   | ⚙️  System Tools                  |")
-        print("|   4   | 🔧 Developer Setup               |")
-        print("+-------+----------------------------------+")
-        print("|   0   | 🚪 Exit                          |")
-        print("+-------+----------------------------------+")
+        # Flush the text layer first so the banner lands before the
+        # pre-encoded frame pushed straight into the byte buffer
+        sys.stdout.flush()
+        sys.stdout.buffer.write(self._main_frame)
+        sys.stdout.buffer.flush()
 
     def _print_submenu(self, path: List[str]):
         """Print submenu based on path"""
-        current = self.menus
-        title_path = []
-        
-        # Navigate to current menu level
-        for p in path:
-            if p in current:
-                current = current[p]
-                title_path.append(current.get("title", ""))
-                if "items" in current:
-                    current = current["items"]
-            else:
-                print(f"Invalid path: {'.'.join(path)}")
-                return
+        key = tuple(path)
+        if key == self._GEMINI_ACCOUNTS_PATH:
+            # The account list is live data — rendered between the
+            # breadcrumb and the pre-built items table
+            crumb, table = self._rendered[key]
+            print(crumb)
+            self._print_gemini_accounts()
+            sys.stdout.write(table)
+            sys.stdout.flush()
+            return
 
-        # Print current path
-        print(f"📍 {' > '.join(['Main Menu'] + title_path):<59}")
-
-        # Special handling for Gemini Account Management menu
-        if len(path) == 4 and path[0] == "1" and path[1] == "3" and path[2] == "2" and path[3] == "3":
-            try:
-                # Import account manager
-                from categorie.data_ai.ai_development.gemini_tools.account_manager import GeminiAccountManager
-                manager = GeminiAccountManager()
-                accounts = manager.list_accounts()
-                
-                if accounts:
-                    print("\n=== Registered Gemini Accounts ===")
-                    print("+-------+----------------------------------+------------------+")
-                    print("| Index |              Email               |     Status      |")
-                    print("+-------+----------------------------------+------------------+")
-                    for i, acc in enumerate(accounts, 1):
-                        status = "🟢 Current" if acc["is_current"] else "⚪ Available"
-                        email = acc["email"][:32]  # Truncate if too long
-                        print(f"|   {i:<3} | {email:<32} | {status:<14} |")
-                    print("+-------+----------------------------------+------------------+\n")
-                else:
-                    print("\n⚠️  No Gemini accounts registered yet.\n")
-            except Exception as e:
-                print(f"\n⚠️  Error loading accounts: {str(e)}\n")
+        frame = self._frames.get(key)
+        if frame is None:
+            print(f"Invalid path: {'.'.join(path)}")
+            return
+        sys.stdout.flush()
+        sys.stdout.buffer.write(frame)
+        sys.stdout.buffer.flush()
 
-        # Print menu items table
-        print("+-------+----------------------------------+")
-        print("| Index |              Title               |")
-        print("+-------+----------------------------------+")
-        
-        # Print menu items
-        for key, value in current.items():
-            # Skip List Accounts option since we're showing the list automatically
-            if len(path) == 4 and path[0] == "1" and path[1] == "3" and path[2] == "2" and path[3] == "3":
-                if key == "2":  # Skip "List Accounts" option
-                    continue
-            title = value.get('title', value) if isinstance(value, dict) else value
-            print(f"|   {key:<3} | {title:<32} |")
+    def _print_gemini_accounts(self):
+        """Print the registered Gemini accounts table"""
+        try:
+            # Import account manager
+            from categorie.data_ai.ai_development.gemini_tools.account_manager import GeminiAccountManager
+            manager = GeminiAccountManager()
+            accounts = manager.list_accounts()
 
-        # Print navigation options
-        print("+-------+----------------------------------+")
-        print("|   b   | ⬅️ Back                           |")
-        print("|   m   | 🏠 Main Menu                     |")
-        print("|   0   | 🚪 Exit                          |")
-        print("+-------+----------------------------------+")
+            if not accounts:
+                print("\n⚠️  No Gemini accounts registered yet.\n")
+                return
+            # Accumulate the table and flush it with one write — the
+            # per-row prints each took the stdout lock and a syscall
+            rule = "+-------+----------------------------------+------------------+"
+            lines = [
+                "\n=== Registered Gemini Accounts ===",
+                rule,
+                "| Index |              Email               |     Status      |",
+                rule,
+            ]
+            if self._ascii:
+                current, available = "[x] Current", "[ ] Available"
+            else:
+                current, available = "🟢 Current", "⚪ Available"
+            for i, acc in enumerate(accounts, 1):
+                status = current if acc["is_current"] else available
+                email = acc["email"][:32]  # Truncate if too long
+                lines.append(f"|   {i:<3} | {email:<32} | {status:<14} |")
+            lines.append(rule + "\n")
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+        except Exception as e:
+            print(f"\n⚠️  Error loading accounts: {str(e)}\n")
 
     def get_input(self) -> str:
         """Get user input"""
-        return input("\nEnter your choice: ").strip().lower()
+        # Valid choices are all single characters, so only the first one
+        # needs lowercasing — no full-string .lower() pass. Interning
+        # lines the result up with the interned menu/tool-map keys so the
+        # lookups that follow compare by identity.
+        raw = input("\nEnter your choice: ").strip()
+        if not raw:
+            return ""
+        return sys.intern(raw[:1].lower() + raw[1:])
 
     def get_current_menu(self, path: List[str]) -> Dict:
         """Get the menu structure at the current path"""
-        current = self.menus
-        
-        # Navigate to current menu level
-        for p in path:
-            if p in current:
-                current = current[p]
-                if "items" in current:
-                    current = current["items"]
-            else:
-                return {}
-                
-        return current
+        node = self._nodes.get(tuple(path))
+        return node[0] if node is not None else {}
 
     def is_valid_choice(self, choice: str, current_menu: Dict) -> bool:
         """Check if the input choice is valid for current menu"""
-        if choice in ['0', 'b', 'm']:
+        if choice in self._NAV_KEYS:
             return True
-        return choice in current_menu 
\ No newline at end of file
+        return choice in self._current_valid or choice in current_menu 
\ No newline at end of file
@@ -1,88 +1,221 @@
-from typing import List, Dict, Optional
+from typing import Dict, FrozenSet, Optional, Sequence
 import importlib
+import importlib.util
 import os
+import sys
 
-def get_tool_module(path: List[str]) -> Optional[str]:
+# ANSI "cursor home + erase display" — clears the screen with one write
+# instead of forking a `clear`/`cls` subprocess per redraw
+_CLEAR = "\x1b[H\x1b[2J"
+
+if os.name == 'nt':
+    try:
+        import colorama
+        colorama.just_fix_windows_console()
+    except Exception:
+        # No colorama: flip ENABLE_VIRTUAL_TERMINAL_PROCESSING ourselves so
+        # the ANSI clear/color sequences still work on Windows 10+ consoles
+        try:
+            import ctypes
+            _kernel32 = ctypes.windll.kernel32
+            _handle = _kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+            _mode = ctypes.c_uint32()
+            if _kernel32.GetConsoleMode(_handle, ctypes.byref(_mode)):
+                _kernel32.SetConsoleMode(_handle, _mode.value | 0x0004)
+        except Exception:
+            pass
+
+def clear_screen() -> None:
+    """Clear the terminal via ANSI escapes (no subprocess spawn)"""
+    sys.stdout.write(_CLEAR)
+    sys.stdout.flush()
+
+_COLORS = {
+    "red": "\x1b[31m",
+    "green": "\x1b[32m",
+    "yellow": "\x1b[33m",
+    "magenta": "\x1b[35m",
+    "cyan": "\x1b[36m",
+    "grey": "\x1b[90m",
+}
+_RESET = "\x1b[0m"
+
+try:
+    import readchar as _readchar
+    from readchar import key as _readchar_key
+except ImportError:
+    _readchar = None
+    _readchar_key = None
+
+def _color(text: str, color: str) -> str:
+    """Return text wrapped in ANSI color codes (string-building variant of print_colored)"""
+    return f"{_COLORS.get(color, '')}{text}{_RESET}"
+
+def _getch() -> str:
+    """Read a single key without waiting for Enter.
+
+    Fallback for single-character menus when readchar is not installed —
+    a line-buffered input() both adds latency and reads more than needed.
+    """
+    if os.name == 'nt':
+        import msvcrt
+        return msvcrt.getwch()
+    import termios
+    import tty
+    fd = sys.stdin.fileno()
+    old = termios.tcgetattr(fd)
+    try:
+        tty.setraw(fd)
+        return sys.stdin.read(1)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old)
+
+def _read_menu_key() -> Optional[str]:
+    """Read one menu key: None means "go back" (ESC/LEFT/b/<), otherwise the
+    lowercased character ('' on read errors, which no menu option matches).
+
+    Shared by the interactive menus so the readchar / raw-stdin fallback
+    handling lives in one place instead of being duplicated per menu loop.
+    """
+    if _readchar is not None:
+        try:
+            c = _readchar.readkey()
+        except Exception:
+            return ''
+        if c in ("\x1b", _readchar_key.ESC, _readchar_key.LEFT):
+            return None
+    else:
+        try:
+            c = _getch()
+        except Exception:
+            return ''
+        if c == '\x1b':
+            return None
+    if c in ('b', 'B', '<'):
+        return None
+    return c.lower()
+
+# Map of tool modules to the menu paths that launch them (dotted form for
+# readability). Listing each module once keeps multi-entry tools like
+# adb_tools from repeating their module path per menu key.
+_BY_MODULE = {
+    # Data & AI Utilities
+    "categorie.data_ai.vision_tool.roboflow_tool.upload_model": ["1.1.1.1"],
+    "categorie.data_ai.vision_tool.roboflow_tool.add_account": ["1.1.1.2"],
+    "categorie.data_ai.vision_tool.roboflow_tool.delete_account": ["1.1.1.3"],
+    "categorie.data_ai.vision_tool.roboflow_tool.switch_account": ["1.1.1.4"],
+    "categorie.data_ai.vision_tool.video_tool.video_to_frames": ["1.1.2.1"],
+    "categorie.data_ai.vision_tool.multimodal_tool.image_annotator": ["1.1.3.1"],
+    "categorie.data_ai.dataset_tools.format_conversion.coco_to_yolo": ["1.2.1.1"],
+    "categorie.data_ai.ai_development.huggingface_tools.huggingface_manager": [
+        "1.3.1.1", "1.3.1.2"],
+    "categorie.data_ai.ai_development.gemini_tools.gemini_tools": [
+        "1.3.2.1", "1.3.2.2"],
+    "categorie.data_ai.ai_development.gemini_tools.account_manager": [
+        "1.3.2.3.1", "1.3.2.3.2", "1.3.2.3.3", "1.3.2.3.4"],
+
+    # Mobile Development
+    "categorie.mobile_dev.android_tools.adb_management.adb_tools": [
+        "2.1.1.1", "2.1.1.2", "2.1.1.3", "2.1.1.4"],
+    "categorie.mobile_dev.android_tools.build_tools.build_tools": ["2.1.2.1"],
+
+    # System Tools
+    "categorie.system_tools.performance_monitor.system_monitor": [
+        "3.1.1", "3.1.2", "3.1.3", "3.1.4"],
+    "categorie.system_tools.network_tools.request_logger": ["3.2.1"],
+    "categorie.system_tools.ssh_management.ssh_manager": [
+        "3.3.1", "3.3.2", "3.3.3"],
+
+    # Developer Setup
+    "categorie.dev_setup.env_setup.dev_tools_installer": [
+        "4.1.1", "4.2.1", "4.2.2"]
+}
+
+# Tuple-keyed lookup table so get_tool_module never joins the path into a
+# fresh string per call. sys.intern guarantees paths sharing a module
+# resolve to the very same str object, so downstream caches can compare
+# results by identity.
+_TOOL_MAP = {
+    tuple(sys.intern(part) for part in k.split(".")): sys.intern(m)
+    for m, keys in _BY_MODULE.items()
+    for k in keys
+}
+
+def get_tool_module(path: Sequence[str]) -> Optional[str]:
     """
     Get the module path for a tool based on the menu path
-    
+
     Args:
-        path (List[str]): Current menu path
-        
+        path (Sequence[str]): Current menu path
+
     Returns:
         Optional[str]: Module path if found, None otherwise
     """
-    # Map of menu paths to module paths
-    tool_map = {
-        # Data & AI Utilities
-        "1.1.1.1": "categorie.data_ai.vision_tool.roboflow_tool.upload_model",
-        "1.1.1.2": "categorie.data_ai.vision_tool.roboflow_tool.add_account",
-        "1.1.1.3": "categorie.data_ai.vision_tool.roboflow_tool.delete_account",
-        "1.1.1.4": "categorie.data_ai.vision_tool.roboflow_tool.switch_account",
-        "1.1.2.1": "categorie.data_ai.vision_tool.video_tool.video_to_frames",
-        "1.1.3.1": "categorie.data_ai.vision_tool.multimodal_tool.image_annotator",
-        "1.2.1.1": "categorie.data_ai.dataset_tools.format_conversion.coco_to_yolo",
-        "1.3.1.1": "categorie.data_ai.ai_development.huggingface_tools.huggingface_manager",
-        "1.3.1.2": "categorie.data_ai.ai_development.huggingface_tools.huggingface_manager",
-        "1.3.2.1": "categorie.data_ai.ai_development.gemini_tools.gemini_tools",
-        "1.3.2.2": "categorie.data_ai.ai_development.gemini_tools.gemini_tools",
-        "1.3.2.3.1": "categorie.data_ai.ai_development.gemini_tools.account_manager",
-        "1.3.2.3.2": "categorie.data_ai.ai_development.gemini_tools.account_manager",
-        "1.3.2.3.3": "categorie.data_ai.ai_development.gemini_tools.account_manager",
-        "1.3.2.3.4": "categorie.data_ai.ai_development.gemini_tools.account_manager",
-        
-        # Mobile Development
-        "2.1.1.1": "categorie.mobile_dev.android_tools.adb_management.adb_tools",
-        "2.1.1.2": "categorie.mobile_dev.android_tools.adb_management.adb_tools",
-        "2.1.1.3": "categorie.mobile_dev.android_tools.adb_management.adb_tools",
-        "2.1.1.4": "categorie.mobile_dev.android_tools.adb_management.adb_tools",
-        "2.1.2.1": "categorie.mobile_dev.android_tools.build_tools.build_tools",
-        
-        # System Tools
-        "3.1.1": "categorie.system_tools.performance_monitor.system_monitor",
-        "3.1.2": "categorie.system_tools.performance_monitor.system_monitor",
-        "3.1.3": "categorie.system_tools.performance_monitor.system_monitor",
-        "3.1.4": "categorie.system_tools.performance_monitor.system_monitor",
-        "3.2.1": "categorie.system_tools.network_tools.request_logger",
-        "3.3.1": "categorie.system_tools.ssh_management.ssh_manager",
-        "3.3.2": "categorie.system_tools.ssh_management.ssh_manager",
-        "3.3.3": "categorie.system_tools.ssh_management.ssh_manager",
-        
-        # Developer Setup
-        "4.1.1": "categorie.dev_setup.env_setup.dev_tools_installer",
-        "4.2.1": "categorie.dev_setup.env_setup.dev_tools_installer",
-        "4.2.2": "categorie.dev_setup.env_setup.dev_tools_installer"
-    }
-    
-    path_key = ".".join(path)
-    return tool_map.get(path_key)
-
-def execute_tool(path: List[str]) -> None:
+    # Tuples pass straight through; lists cost one conversion
+    if type(path) is not tuple:
+        path = tuple(path)
+    return _TOOL_MAP.get(path)
+
+def _find_available() -> FrozenSet[str]:
+    """Resolve which tool modules actually exist, once at import.
+
+    find_spec only walks the finders without executing the module, so
+    missing tools can later be rejected with a set probe instead of
+    paying for import machinery that ends in an ImportError.
+    """
+    available = set()
+    for module_path in _BY_MODULE:
+        try:
+            spec = importlib.util.find_spec(module_path)
+        except (ImportError, ValueError):
+            spec = None
+        if spec is not None:
+            available.add(module_path)
+    return frozenset(available)
+
+_AVAILABLE = _find_available()
+
+# Loaded tool modules with their resolved entry points — relaunching a
+# tool is then a dict hit plus the call, skipping importlib's finder/
+# loader machinery and the repeated getattr probe
+_MODULE_CACHE: Dict[str, tuple] = {}
+
+def execute_tool(path: Sequence[str]) -> None:
     """
     Execute the tool based on the menu path
-    
+
     Args:
-        path (List[str]): Current menu path
+        path (Sequence[str]): Current menu path
     """
     module_path = get_tool_module(path)
     if not module_path:
         print("\n⚠️  This menu option doesn't have an associated tool yet.")
         input("\nPress Enter to continue...")
         return
-        
+
+    if module_path not in _AVAILABLE:
+        print(f"\n❌ Tool module not available: {module_path}")
+        input("\nPress Enter to continue...")
+        return
+
     try:
         # Set menu path environment variable
         os.environ['MENU_PATH'] = '.'.join(path)
-        
-        # Import the module
-        module = importlib.import_module(module_path)
-        
+
+        # Import the module (cached after the first launch)
+        cached = _MODULE_CACHE.get(module_path)
+        if cached is None:
+            module = importlib.import_module(module_path)
+            cached = (module, getattr(module, 'main', None))
+            _MODULE_CACHE[module_path] = cached
+        _, main = cached
+
         # Execute the main function if it exists
-        if hasattr(module, 'main'):
-            module.main()
+        if main is not None:
+            main()
         else:
             print("\n⚠️  Tool implementation not found.")
-        
+
         input("\nPress Enter to continue...")
         
     except ImportError as e:
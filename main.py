@@ -11,18 +11,27 @@ def start():
     # Create menu instance
     menu = Menu()
     current_path = []
-    
+
+    # Redraw only when the screen content actually changed: navigation,
+    # returning from a tool, or recovering from an error. Invalid input
+    # that leaves the path untouched keeps the current frame.
+    last_drawn = None
+    dirty = True
+
     while True:
         try:
             # Display menu
-            menu.print_menu(current_path)
-            
+            if dirty or tuple(current_path) != last_drawn:
+                menu.print_menu(current_path)
+                last_drawn = tuple(current_path)
+                dirty = False
+
             # Get user input
             choice = menu.get_input()
-            
+
             # Get current menu structure
             current_menu = menu.get_current_menu(current_path)
-            
+
             # Handle navigation choices
             if choice == '0':
                 print("\nExiting...\n")
@@ -33,21 +42,26 @@ def start():
                 current_path = []
             # Handle valid menu choices
             elif menu.is_valid_choice(choice, current_menu):
-                # Check if this is a submenu or a tool
-                if isinstance(current_menu[choice], dict):
-                    current_path.append(choice)
+                # Tool entries were indexed by full path at menu build
+                # time, so tool-vs-submenu is a single set membership test
+                full = (*current_path, choice)
+                if full in menu._leaf_paths:
+                    # This is a tool, execute it (full is already the
+                    # tuple shape the tool map is keyed by)
+                    execute_tool(full)
+                    dirty = True
                 else:
-                    # This is a tool, execute it
-                    new_path = current_path + [choice]
-                    execute_tool(new_path)
+                    current_path.append(choice)
             else:
                 print("\nInvalid choice! Please try again.")
                 input("Press Enter to continue...")
+                dirty = True
 
         except Exception as e:
             print(f"\nMenu error: {e}")
             input("Press Enter to return to main menu...")
             current_path = []
+            dirty = True
 
 if __name__ == "__main__":
     try: